@@ -29,6 +29,12 @@ namespace RaccoonIsland
 
         private readonly Dictionary<string, List<LargeTerrainFeature>> _savedCustomFeatures = new();
 
+        // Spawn candidate tiles and tree placements, precomputed by generate_map.py
+        // and generate_trees.py (see SpawnTables and TreePlacements)
+        private List<Vector2> _beachTiles = new();
+        private List<Vector2> _townTiles = new();
+        private TreePlacements _trees = new();
+
         private Vector2 _hoverTile = new Vector2(-1, -1);
         private double _hoverStartTime;
         private string _hoverTreeName;
@@ -62,6 +68,10 @@ namespace RaccoonIsland
 
         private void OnGameLaunched(object sender, GameLaunchedEventArgs e)
         {
+            var spawns = Helper.ModContent.Load<SpawnTables>("assets/RaccoonIsland.spawns.json");
+            _beachTiles = SpawnTables.ToTiles(spawns.Beach);
+            _townTiles = SpawnTables.ToTiles(spawns.Town);
+            _trees = Helper.ModContent.Load<TreePlacements>("assets/RaccoonIsland.trees.json");
             Monitor.Log("Raccoon Island mod launched!", LogLevel.Info);
         }
 
@@ -296,58 +306,32 @@ namespace RaccoonIsland
 
         private void SpawnForestTrees(GameLocation island)
         {
-            const int width = 80, height = 80;
-            const float cx = 40f, cy = 40f;
-            const float forestMin = 14f, beachMin = 22f;
-            const int spacing = 2; // minimum tiles between trees (keeps fruit trees growing)
-            // All tree types in a single pool for equal distribution
-            // Wild: oak(1), maple(2), pine(3), coconut palm(6)
-            // Fruit: pomegranate(632), apple(633), orange(630), cherry(628), apricot(629)
-            string[] allTypes = { "1", "2", "3", "6", "632", "633", "630", "628", "629" };
+            // Positions are Poisson-disk sampled at least 3 tiles apart (keeps fruit trees growing),
+            // types dealt out evenly: oak(1), maple(2), pine(3), coconut palm(6),
+            // pomegranate(632), apple(633), orange(630), cherry(628), apricot(629)
+            int[] trees = _trees.Trees;
             int treeCount = 0;
-            int typeIndex = 0;
-
-            var occupied = new HashSet<(int, int)>();
 
-            for (int y = 0; y < height; y++)
+            for (int i = 0; i + 2 < trees.Length; i += 3)
             {
-                for (int x = 0; x < width; x++)
-                {
-                    float dist = (float)Math.Sqrt((x - cx) * (x - cx) + (y - cy) * (y - cy));
-                    if (dist <= forestMin || dist > beachMin)
-                        continue;
-
-                    if (x == 39 || x == 40 || y == 39 || y == 40)
-                        continue;
+                var tile = new Vector2(trees[i], trees[i + 1]);
+                string type = _trees.Types[trees[i + 2]];
 
-                    if (occupied.Contains((x, y)))
-                        continue;
-
-                    var tile = new Vector2(x, y);
-                    string type = allTypes[typeIndex % allTypes.Length];
-                    typeIndex++;
-
-                    int typeNum = int.Parse(type);
-                    if (typeNum >= 628)
-                    {
-                        var ft = new FruitTree(type, 4);
-                        ft.GreenHouseTileTree = true;
-                        island.terrainFeatures[tile] = ft;
-                    }
-                    else
-                    {
-                        island.terrainFeatures[tile] = new Tree(type, Tree.treeStage);
-                    }
-                    treeCount++;
-
-                    // Reserve surrounding tiles so no tree is placed within spacing distance
-                    for (int dy = -spacing; dy <= spacing; dy++)
-                        for (int dx = -spacing; dx <= spacing; dx++)
-                            occupied.Add((x + dx, y + dy));
+                int typeNum = int.Parse(type);
+                if (typeNum >= 628)
+                {
+                    var ft = new FruitTree(type, 4);
+                    ft.GreenHouseTileTree = true;
+                    island.terrainFeatures[tile] = ft;
                 }
+                else
+                {
+                    island.terrainFeatures[tile] = new Tree(type, Tree.treeStage);
+                }
+                treeCount++;
             }
 
-            Monitor.Log($"Spawned {treeCount} trees (9 types, equal distribution) on Raccoon Island.", LogLevel.Info);
+            Monitor.Log($"Spawned {treeCount} trees ({_trees.Types.Length} types, equal distribution) on Raccoon Island.", LogLevel.Info);
         }
 
         private void OnDayStarted(object sender, DayStartedEventArgs e)
@@ -390,16 +374,10 @@ namespace RaccoonIsland
                 "851", // Magma Cap
             };
 
-            var townTiles = new List<Vector2>();
-            for (int y = 0; y < 80; y++)
-            {
-                for (int x = 0; x < 80; x++)
-                {
-                    float dist = (float)Math.Sqrt((x - CX) * (x - CX) + (y - CY) * (y - CY));
-                    if (dist > 5f && dist <= 12f && x != 39 && x != 40 && y != 39 && y != 40)
-                        townTiles.Add(new Vector2(x, y));
-                }
-            }
+            // Town ring tiles off the paths, plaza and tent pads
+            var townTiles = _townTiles;
+            if (townTiles.Count == 0)
+                return;
 
             int spawned = 0;
             int attempts = 0;
@@ -441,16 +419,10 @@ namespace RaccoonIsland
                     break;
             }
 
-            var beachTiles = new List<Vector2>();
-            for (int y = 0; y < 80; y++)
-            {
-                for (int x = 0; x < 80; x++)
-                {
-                    float dist = (float)Math.Sqrt((x - CX) * (x - CX) + (y - CY) * (y - CY));
-                    if (dist > 22f && dist <= 27f)
-                        beachTiles.Add(new Vector2(x, y));
-                }
-            }
+            // Beach ring tiles off the dock
+            var beachTiles = _beachTiles;
+            if (beachTiles.Count == 0)
+                return;
 
             int spawned = 0;
             int attempts = 0;
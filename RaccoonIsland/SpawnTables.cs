@@ -0,0 +1,29 @@
+using System;
+using System.Collections.Generic;
+using Microsoft.Xna.Framework;
+
+namespace RaccoonIsland
+{
+    /// <summary>
+    /// Spawn candidate tiles per zone, read from assets/RaccoonIsland.spawns.json.
+    /// The file is written by generate_map.py alongside the map, so the tables always
+    /// match the map's zones. Each zone is a flat [x0, y0, x1, y1, ...] array in row order.
+    /// </summary>
+    public class SpawnTables
+    {
+        public int Width { get; set; }
+        public int Height { get; set; }
+        public int[] Forest { get; set; } = Array.Empty<int>();
+        public int[] Beach { get; set; } = Array.Empty<int>();
+        public int[] Town { get; set; } = Array.Empty<int>();
+
+        /// <summary>Unpack a flat coordinate array into tile positions.</summary>
+        public static List<Vector2> ToTiles(int[] packed)
+        {
+            var tiles = new List<Vector2>(packed.Length / 2);
+            for (int i = 0; i + 1 < packed.Length; i += 2)
+                tiles.Add(new Vector2(packed[i], packed[i + 1]));
+            return tiles;
+        }
+    }
+}
@@ -0,0 +1,19 @@
+using System;
+
+namespace RaccoonIsland
+{
+    /// <summary>
+    /// Forest tree positions and types, read from assets/RaccoonIsland.trees.json.
+    /// The file is written by generate_trees.py (Poisson-disk sampling over the forest ring).
+    /// Trees is a flat [x0, y0, t0, x1, y1, t1, ...] array; each t indexes into Types.
+    /// </summary>
+    public class TreePlacements
+    {
+        public int Width { get; set; }
+        public int Height { get; set; }
+        public int Seed { get; set; }
+        public float Radius { get; set; }
+        public string[] Types { get; set; } = Array.Empty<string>();
+        public int[] Trees { get; set; } = Array.Empty<int>();
+    }
+}
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""Build every generated asset, in dependency order and in parallel.
+
+Each generator is a node in NODES with the files it writes and the data
+files it reads; the Python sources it runs (the script and the local
+modules it imports, followed transitively) are found automatically. A
+node that reads another node's output runs after it. Independent nodes
+run at the same time in a process pool, each script executed in-process
+with runpy so workers keep NumPy and PIL imported between scripts.
+
+A node is skipped when the hash of its sources, inputs and arguments
+matches the last successful build and its outputs exist. File hashes are
+cached by (mtime, size) in .build_state.json, so a no-op build only stats
+files. Files in assets/ that no node writes and that are not hand-made
+(HAND_MADE) are reported as orphans, such as the old 8-direction
+TentInteriorNW/NE/... maps.
+
+Usage:
+    python build.py                  build everything that is out of date
+    python build.py map trees -j 4   build some nodes (and what they need)
+    python build.py --force          rebuild everything
+    python build.py --dry-run        show what would be built
+    python build.py --watch          rebuild whatever each edit affects, until Ctrl+C
+
+--watch polls the same hashes every WATCH_INTERVAL seconds, so an edit
+to a source or input rebuilds exactly the nodes whose digest changed and
+the nodes downstream of them. It keeps one process pool for the whole
+session: workers stay warm with NumPy, PIL and the shared map modules
+imported, and only local modules whose source changed are re-imported.
+"""
+import argparse
+import ast
+import hashlib
+import io
+import json
+import os
+import runpy
+import sys
+import time
+import traceback
+from contextlib import redirect_stdout
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STATE_FILE = os.path.join(HERE, ".build_state.json")
+ASSET_DIR = "assets"
+ASSET_EXTENSIONS = (".tmx", ".tbin", ".png", ".json")
+SHEETS = os.path.join(os.pardir, "extracted_assets")
+# Sheets generate_map registers (missing ones hash as absent)
+MAP_SHEETS = ["spring_outdoorsTileSheet.png", "spring_beach.png", "spring_town.png",
+              "island_tilesheet_1.png"]
+WATCH_INTERVAL = 0.25  # seconds between polls in --watch
+# Imported by each --watch worker up front, so the first rebuild is warm too
+WARM_MODULES = ("numpy", "PIL.Image", "tilesets", "tmx", "tbin")
+
+# Assets made by hand or extracted from the game, not by a generator
+HAND_MADE = {
+    "assets/dark_cat_tree.png", "assets/dark_cat_tree_tiles.png",
+    "assets/junimo_hut.png", "assets/junimo_hut_tiles.png",
+    "assets/long_elixir_table_src.png", "assets/long_elixir_table_tiles.png",
+    "assets/nest_tiles_backup.png",
+}
+
+
+class Node:
+    """One generator run: a script, its arguments, its data inputs and outputs."""
+
+    def __init__(self, name, script, outputs, inputs=(), args=()):
+        self.name = name
+        self.script = script
+        self.outputs = [os.path.normpath(path) for path in outputs]
+        self.inputs = [os.path.normpath(path) for path in inputs]
+        self.args = list(args)
+
+    def __repr__(self):
+        return f"Node({self.name!r})"
+
+
+def sheets(names):
+    """Paths of extracted game sheets, which Tileset.from_image reads for its grid."""
+    return [os.path.join(SHEETS, name) for name in names]
+
+
+def sprite_node(name, spec, output):
+    """A node rendering one sprites/*.json spec with render_sprites.py."""
+    spec = os.path.join("sprites", spec)
+    return Node(name, "render_sprites.py", [output], inputs=[spec], args=[spec])
+
+
+NODES = [
+    sprite_node("nest_tiles", "nest_tiles.json", "assets/nest_tiles.png"),
+    sprite_node("raccoon_god", "raccoon_god.json", "assets/raccoon_god.png"),
+    sprite_node("statue", "raccoon_statue.json", "assets/raccoon_statue.png"),
+    sprite_node("mine_entrance", "mine_entrance.json", "assets/mine_entrance.png"),
+    sprite_node("tent_tiles", "tent_tiles.json", "assets/tent_tiles.png"),
+    Node("map", "generate_map.py",
+         ["assets/RaccoonIsland.tmx", "assets/RaccoonIsland.spawns.json"],
+         inputs=sheets(MAP_SHEETS)),
+    # generate_trees imports the spawn tables from generate_map rather than
+    # reading the .spawns.json, so it sees the same sheets
+    Node("trees", "generate_trees.py", ["assets/RaccoonIsland.trees.json"],
+         inputs=sheets(MAP_SHEETS)),
+    Node("mine", "generate_mine_interior.py", ["assets/RaccoonMine.tmx"],
+         inputs=sheets(["townInterior.png"])),
+    Node("tent_interiors", "generate_tent_interiors.py",
+         [f"assets/TentInterior{i:02d}.tmx" for i in range(1, 13)],
+         inputs=sheets(["townInterior.png", "farmhouse_tiles.png", "walls_and_floors.png"])),
+]
+
+
+def module_imports(path):
+    """Top-level names of the modules a Python file imports (absolute imports only).
+
+    A file that does not parse imports nothing; running it reports the error.
+    """
+    with open(path) as f:
+        source = f.read()
+    try:
+        tree = ast.parse(source, path)
+    except SyntaxError:
+        return []
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".")[0])
+    return sorted(names)
+
+
+def local_imports(script, file_hash, root=HERE):
+    """The script and every module it imports from `root`, transitively.
+
+    Each file's imports are cached with its hash in file_hash.imports, so
+    only changed sources are parsed again.
+    """
+    found, todo = set(), [script]
+    while todo:
+        path = todo.pop()
+        if path in found:
+            continue
+        found.add(path)
+        digest = file_hash(path)
+        cached = file_hash.imports.get(path)
+        if cached is None or cached[0] != digest:
+            cached = file_hash.imports[path] = [digest, module_imports(path)]
+            file_hash.changed = True
+        todo.extend(module for module in (name + ".py" for name in cached[1])
+                    if os.path.exists(os.path.join(root, module)))
+    return sorted(found)
+
+
+class FileHashes:
+    """SHA-1 of files, cached by (mtime_ns, size) across builds."""
+
+    def __init__(self, cache=None, imports=None):
+        self.cache = cache or {}
+        self.imports = imports or {}  # path -> [hash, imported module names]
+        self.changed = False
+
+    def __call__(self, path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        entry = self.cache.get(path)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        self.cache[path] = [st.st_mtime_ns, st.st_size, digest]
+        self.changed = True
+        return digest
+
+
+def load_state(path=STATE_FILE):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_state(state, path=STATE_FILE):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def node_digest(node, file_hash):
+    """Hash of everything a node's outputs depend on."""
+    h = hashlib.sha1(json.dumps([node.script, node.args]).encode())
+    for path in local_imports(node.script, file_hash) + node.inputs:
+        h.update(f"{path}:{file_hash(path)}\n".encode())
+    return h.hexdigest()
+
+
+def dependencies(nodes):
+    """{node name: names of the nodes whose outputs it reads}."""
+    producers = {path: node.name for node in nodes for path in node.outputs}
+    return {node.name: {producers[path] for path in node.inputs if path in producers}
+            for node in nodes}
+
+
+def topological_order(nodes):
+    deps = dependencies(nodes)
+    by_name = {node.name: node for node in nodes}
+    order, done = [], set()
+    while len(order) < len(nodes):
+        ready = [name for name in by_name if name not in done and deps[name] <= done]
+        if not ready:
+            raise ValueError(f"dependency cycle among {sorted(set(by_name) - done)}")
+        for name in ready:
+            order.append(by_name[name])
+            done.add(name)
+    return order
+
+
+def select(nodes, names):
+    """The named nodes plus every node they depend on, in the original order."""
+    deps = dependencies(nodes)
+    unknown = set(names) - set(deps)
+    if unknown:
+        raise KeyError(f"unknown nodes: {', '.join(sorted(unknown))}")
+    wanted, todo = set(), list(names)
+    while todo:
+        name = todo.pop()
+        if name not in wanted:
+            wanted.add(name)
+            todo.extend(deps[name])
+    return [node for node in nodes if node.name in wanted]
+
+
+def _init_worker(root=HERE, warm=()):
+    os.chdir(root)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    for name in warm:
+        __import__(name)
+    _loaded_modules.update(_local_modules(root))
+
+
+# Local modules imported in this worker -> source mtime when imported
+_loaded_modules = {}
+
+
+def _local_modules(root=HERE):
+    modules = {}
+    for name, module in list(sys.modules.items()):
+        if name in ("__main__", "__mp_main__"):  # build.py itself, in a worker
+            continue
+        path = getattr(module, "__file__", None)
+        if path and os.path.dirname(os.path.abspath(path)) == root:
+            try:
+                modules[name] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                modules[name] = None
+    return modules
+
+
+def _forget_stale_modules(root=HERE):
+    """Drop this worker's local modules if any of their sources changed.
+
+    All of them go, since a module that imported a changed one holds on to
+    its old objects; third-party modules such as NumPy stay loaded.
+    """
+    current = _local_modules(root)
+    if any(_loaded_modules.get(name, mtime) != mtime for name, mtime in current.items()):
+        for name in current:
+            del sys.modules[name]
+        _loaded_modules.clear()
+
+
+def run_script(script, args=()):
+    """Run a generator script as __main__; returns (ok, captured output, seconds)."""
+    _forget_stale_modules()
+    began = time.perf_counter()
+    out = io.StringIO()
+    argv = sys.argv
+    sys.argv = [script, *args]
+    ok = True
+    try:
+        with redirect_stdout(out):
+            runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        ok = e.code in (None, 0)
+    except Exception:
+        out.write(traceback.format_exc())
+        ok = False
+    finally:
+        sys.argv = argv
+        for name, mtime in _local_modules().items():
+            _loaded_modules.setdefault(name, mtime)
+    return ok, out.getvalue(), time.perf_counter() - began
+
+
+def orphans(nodes, asset_dir=ASSET_DIR):
+    """Files in assets/ that no node writes and that are not hand-made."""
+    outputs = {path for node in nodes for path in node.outputs}
+    return sorted(path for path in (os.path.join(asset_dir, name) for name in os.listdir(asset_dir))
+                  if path.endswith(ASSET_EXTENSIONS) and path not in outputs
+                  and path not in HAND_MADE)
+
+
+def build(nodes=NODES, jobs=None, force=False, dry_run=False, log=print, pool=None, state=None):
+    """Build out-of-date nodes; returns {node name: "built" | "up to date" | "failed" | ...}.
+
+    `pool` and `state` let a caller that builds repeatedly (--watch) keep
+    its worker processes and the loaded build state between calls.
+    """
+    state = load_state() if state is None else state
+    file_hash = FileHashes(state.get("files"), state.get("imports"))
+    digests = state.setdefault("nodes", {})
+    deps = dependencies(nodes)
+    pending = topological_order(nodes)
+    status, running = {}, {}
+    own_pool = pool is None
+    try:
+        while pending or running:
+            for node in [n for n in pending if deps[n.name] <= status.keys()]:
+                pending.remove(node)
+                if any(status[dep] in ("failed", "skipped") for dep in deps[node.name]):
+                    status[node.name] = "skipped"
+                    log(f"skipped {node.name} (a dependency failed)")
+                    continue
+                digest = node_digest(node, file_hash)
+                if (not force and digests.get(node.name) == digest
+                        and all(os.path.exists(path) for path in node.outputs)):
+                    status[node.name] = "up to date"
+                    continue
+                if dry_run:
+                    status[node.name] = "would build"
+                    log(f"would build {node.name}: {', '.join(node.outputs)}")
+                    continue
+                if pool is None:
+                    from concurrent.futures import ProcessPoolExecutor
+                    pool = ProcessPoolExecutor(jobs, initializer=_init_worker)
+                running[pool.submit(run_script, node.script, node.args)] = (node, digest)
+            if not running:
+                continue
+            from concurrent.futures import FIRST_COMPLETED, wait
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                node, digest = running.pop(future)
+                ok, output, seconds = future.result()
+                if ok:
+                    status[node.name] = "built"
+                    digests[node.name] = digest
+                    log(f"built {node.name} ({seconds:.2f}s)")
+                else:
+                    status[node.name] = "failed"
+                    digests.pop(node.name, None)
+                    log(f"FAILED {node.name}:\n{output}")
+    finally:
+        if own_pool and pool is not None:
+            pool.shutdown()
+        state["files"] = file_hash.cache
+        state["imports"] = file_hash.imports
+        if not dry_run and (file_hash.changed or any(
+                result in ("built", "failed") for result in status.values())):
+            save_state(state)
+    return status
+
+
+def stat_snapshot(paths):
+    """{path: (mtime_ns, size) or None if missing}, to tell cheaply whether anything changed."""
+    snapshot = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+            snapshot[path] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            snapshot[path] = None
+    return snapshot
+
+
+def watch(nodes=NODES, jobs=None, interval=WATCH_INTERVAL, log=print):
+    """Rebuild affected nodes whenever a source, input or output changes, until interrupted.
+
+    A failed node is retried on the next change rather than on every poll.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool = ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(HERE, WARM_MODULES))
+    state = load_state()
+    outputs = [path for node in nodes for path in node.outputs]
+    last = None
+    log(f"watching {len(nodes)} nodes (Ctrl+C to stop)")
+    try:
+        while True:
+            current = stat_snapshot([*state.get("files", {}), *outputs])
+            if current != last:
+                began = time.perf_counter()
+                status = build(nodes, log=log, pool=pool, state=state)
+                changed = [name for name, result in status.items() if result != "up to date"]
+                if changed:
+                    log(f"{', '.join(changed)} done in {time.perf_counter() - began:.2f}s")
+                # Builds rewrite outputs and may hash new files; start from what they left
+                last = stat_snapshot([*state.get("files", {}), *outputs])
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the generated assets.")
+    parser.add_argument("nodes", nargs="*", help="nodes to build (default: all); "
+                        f"one of {', '.join(node.name for node in NODES)}")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if up to date")
+    parser.add_argument("--dry-run", action="store_true", help="only show what would be built")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and rebuild what each change affects")
+    args = parser.parse_args()
+
+    os.chdir(HERE)
+    began = time.perf_counter()
+    try:
+        nodes = select(NODES, args.nodes) if args.nodes else NODES
+    except KeyError as e:
+        parser.error(e.args[0])
+    if args.watch:
+        watch(nodes, args.jobs)
+        sys.exit(0)
+    status = build(nodes, args.jobs, args.force, args.dry_run)
+    counts = {}
+    for result in status.values():
+        counts[result] = counts.get(result, 0) + 1
+    summary = ", ".join(f"{count} {result}" for result, count in sorted(counts.items()))
+    print(f"{summary} ({time.perf_counter() - began:.3f}s)")
+    for path in orphans(NODES):
+        print(f"orphan: {path}")
+    sys.exit(1 if "failed" in counts or "skipped" in counts else 0)
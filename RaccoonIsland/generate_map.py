@@ -11,144 +11,196 @@ Zones (from center outward):
   - Forest ring (14 < dist <= 22): Dense varied tree canopy
   - Beach ring (22 < dist <= 27): Sandy beach ground
   - Water border (dist > 27): Deep ocean with Water property
+
+The 80x80 layout is the reference design. --size (or --width/--height)
+scales it proportionally, ring radii can be overridden individually, and
+layers are generated in row bands so very large islands stay cheap:
+
+    python generate_map.py --size 2000 -o assets/RaccoonIslandXL.tmx
+
+Next to the map it writes <map>.spawns.json, the forest, beach and town
+cells ModEntry spawns trees and forageables on (see spawn_tables), so the
+mod does not recompute the zones.
 """
 
-import math
+import argparse
+import io
+import json
+import os
+
+import numpy as np
+
+from tbin import write_tbin
+from tilesets import Tileset, TilesetRegistry
+from tmx import TileMap, add_encoding_args, check_encoding_args
 
 WIDTH = 80
 HEIGHT = 80
 CX, CY = 40, 40
 
-# === Tilesheet 1: spring_outdoorsTileSheet ===
-# 400x1264, 25 cols x 79 rows, firstgid=1
-OUT_FIRSTGID = 1
-OUT_COLS = 25
+# === Tilesheets, registered in map order (firstgids are allocated) ===
+TILESETS = TilesetRegistry()
+# 400x1264, 25 cols x 79 rows
+OUTDOORS = TILESETS.add(Tileset.from_image(
+    "outdoors", "Maps/spring_outdoorsTileSheet.png", size=(400, 1264)))
+# 272x496, 17 cols x 31 rows
+BEACH = TILESETS.add(Tileset.from_image("z_beach", "Maps/spring_beach.png", size=(272, 496)))
+# 512x1152, 32 cols x 72 rows
+TOWN = TILESETS.add(Tileset.from_image("z_town", "Maps/spring_town.png", size=(512, 1152)))
+# 512x1040, 32 cols x 65 rows (base non-seasonal island tilesheet)
+ISLAND = TILESETS.add(Tileset.from_image(
+    "z_island", "Maps/island_tilesheet_1.png", size=(512, 1040)))
 
-WATER = 1275      # row 50, col 24 — uniform dark blue RGB(58,125,149)
-GRASS = 176       # row 7, col 0  — bright green RGB(74,164,29)
-COBBLE = 979      # row 39, col 3 — gray stone RGB(141,145,148)
 
-# (Trees are now spawned as TerrainFeature objects in ModEntry.cs)
+def water_properties(tile_ids):
+    return {tid: {"Water": "T"} for tid in tile_ids}
 
-# === Tilesheet 2: spring_beach ===
-# 272x496, 17 cols x 31 rows, firstgid=1976
-BEACH_FIRSTGID = 1976
-BEACH_COLS = 17
 
-def beach_gid(row, col):
-    return BEACH_FIRSTGID + row * BEACH_COLS + col
+# === Tilesheet 1: spring_outdoorsTileSheet ===
+WATER = OUTDOORS.gid(50, 24)   # uniform dark blue RGB(58,125,149)
+GRASS = OUTDOORS.gid(7, 0)     # bright green RGB(74,164,29)
+COBBLE = OUTDOORS.gid(39, 3)   # gray stone RGB(141,145,148)
+
+# (Trees are placed by generate_trees.py and spawned as TerrainFeatures in ModEntry.cs)
 
+# === Tilesheet 2: spring_beach ===
 # Shallow turquoise water — row 3, cols 6-8
-SHALLOW_WATER = [beach_gid(3, c) for c in range(6, 9)]
+SHALLOW_WATER = [BEACH.gid(3, c) for c in range(6, 9)]
 # Ocean water from beach sheet (rows 0-1, cols 7-9 mid-blue; cols 10-11 deep blue)
-OCEAN_MID = [beach_gid(r, c) for r in range(2) for c in range(7, 10)]
-OCEAN_DEEP = [beach_gid(r, c) for r in range(2) for c in range(10, 12)]
+OCEAN_MID = [BEACH.gid(r, c) for r in range(2) for c in range(7, 10)]
+OCEAN_DEEP = [BEACH.gid(r, c) for r in range(2) for c in range(10, 12)]
 # All ocean tiles get the Water property (game draws animated water overlay on these)
 BEACH_WATER_TILE_IDS = sorted(set(
-    [gid - BEACH_FIRSTGID for gid in OCEAN_MID + OCEAN_DEEP]
+    [gid - BEACH.firstgid for gid in OCEAN_MID + OCEAN_DEEP]
 ))
+BEACH.tile_properties = water_properties(BEACH_WATER_TILE_IDS)
 
-# === Tilesheet 5: island_tilesheet_1 ===
-# 512x1040, 32 cols x 65 rows (base non-seasonal island tilesheet)
-ISLAND_FIRSTGID = 4816
-ISLAND_COLS = 32
-
-def island_gid(row, col):
-    return ISLAND_FIRSTGID + row * ISLAND_COLS + col
-
+# === Tilesheet 4: island_tilesheet_1 ===
 # Tropical ocean tiles — row 0, cols 0-15 (turquoise/teal, semi-transparent)
 # These overlay on top of a solid dark teal base
-ISLAND_OCEAN = [island_gid(0, c) for c in range(16)]
+ISLAND_OCEAN = [ISLAND.gid(0, c) for c in range(16)]
 # Tile IDs within the island tilesheet that should have Water property
 ISLAND_WATER_TILE_IDS = list(range(16))  # row 0, cols 0-15
+ISLAND.tile_properties = water_properties(ISLAND_WATER_TILE_IDS)
 
 # Wooden dock plank tiles — from island tilesheet row 17 (Ginger Island pier planks)
-DOCK_PLANKS = [island_gid(17, c) for c in range(5, 9)]
+DOCK_PLANKS = [ISLAND.gid(17, c) for c in range(5, 9)]
 
 # Dry sand — from island tilesheet (flat tropical sand tiles)
 DRY_SAND = [
-    island_gid(1, 5), island_gid(1, 6), island_gid(1, 8),  # light sand
-    island_gid(2, 1), island_gid(2, 7), island_gid(2, 8),  # light sand variants
-    island_gid(3, 7), island_gid(3, 8),                     # slightly darker sand
-    island_gid(4, 1), island_gid(4, 2), island_gid(4, 3),  # more variants
+    ISLAND.gid(1, 5), ISLAND.gid(1, 6), ISLAND.gid(1, 8),  # light sand
+    ISLAND.gid(2, 1), ISLAND.gid(2, 7), ISLAND.gid(2, 8),  # light sand variants
+    ISLAND.gid(3, 7), ISLAND.gid(3, 8),                    # slightly darker sand
+    ISLAND.gid(4, 1), ISLAND.gid(4, 2), ISLAND.gid(4, 3),  # more variants
 ]
 
-# === Tilesheet 3: spring_town ===
-# 512x1152, 32 cols x 72 rows, firstgid=2503
-TOWN_FIRSTGID = 2503
-TOWN_COLS = 32
-
-
-def town_gid(row, col):
-    return TOWN_FIRSTGID + row * TOWN_COLS + col
-
-
 
 # === Zone thresholds ===
 WATER_MIN = 27
 BEACH_MIN = 22
 FOREST_MIN = 14
-
-
-def get_dist(x, y):
-    return math.sqrt((x - CX) ** 2 + (y - CY) ** 2)
-
-
-def get_zone(x, y):
-    dist = get_dist(x, y)
-    if dist > WATER_MIN:
-        return "water"
-    elif dist > BEACH_MIN:
-        return "beach"
-    elif dist > FOREST_MIN:
-        return "forest"
-    else:
-        return "town"
-
-
-def is_ns_path(x, y):
-    return x in (39, 40) and get_zone(x, y) == "forest"
-
-
-def is_ew_path(x, y):
-    return y in (39, 40) and get_zone(x, y) == "forest"
-
-
-def is_dock(x, y):
-    """Small south-facing pier like Ginger Island — 2 tiles wide, extends from beach into water."""
-    if x not in (39, 40):
-        return False
-    return 65 <= y <= 70
-
-
-def is_plaza(x, y):
-    return abs(x - CX) <= 3 and abs(y - CY) <= 3 and get_zone(x, y) == "town"
-
-
-def is_town_path(x, y):
-    if get_zone(x, y) != "town":
-        return False
-    return x in (39, 40) or y in (39, 40)
-
-
+DEEP_WATER_MIN = 32  # beyond this the Buildings layer blocks swimming
+PLAZA_HALF = 3       # plaza spans CX-3..CX+3, CY-3..CY+3
+DOCK_Y = (65, 70)    # pier rows, inclusive
+TOWN_SPAWN = (5, 12)  # town forageables spawn at 5 < dist <= 12
+
+BAND_ROWS = 64  # rows generated per chunk
+
+
+class IslandLayout:
+    """Island geometry, scaled proportionally from the 80x80 reference design.
+
+    The center, ring radii, plaza, dock, deep-water line and tent pad
+    positions all scale with min(width, height) / 80; paths, the dock and
+    tent pads keep their tile widths. At 80x80 this is exactly the
+    module-level design.
+    """
+
+    def __init__(self, width=WIDTH, height=HEIGHT,
+                 water_min=None, beach_min=None, forest_min=None):
+        scale = self.scale = min(width, height) / WIDTH
+        self.width, self.height = width, height
+        self.cx, self.cy = width // 2, height // 2
+        self.water_min = WATER_MIN * scale if water_min is None else water_min
+        self.beach_min = BEACH_MIN * scale if beach_min is None else beach_min
+        self.forest_min = FOREST_MIN * scale if forest_min is None else forest_min
+        self.deep_water_min = DEEP_WATER_MIN * scale
+        self.town_spawn = (TOWN_SPAWN[0] * scale, TOWN_SPAWN[1] * scale)
+        self.plaza_half = round(PLAZA_HALF * scale)
+        self.path = (self.cx - 1, self.cx)  # 2-tile N/S path columns (and E/W path rows)
+        self.path_rows = (self.cy - 1, self.cy)
+        self.dock_y = (self.cy + round((DOCK_Y[0] - CY) * scale),
+                       self.cy + round((DOCK_Y[1] - CY) * scale))
+        self.tent_pads = [
+            dict(pad, x=self.cx + round((pad["x"] - CX) * scale),
+                 y=self.cy + round((pad["y"] - CY) * scale))
+            for pad in TENT_PADS
+        ]
+        self.buildings = [
+            dict(b, x=self.cx + round((b["x"] - CX) * scale),
+                 y=self.cy + round((b["y"] - CY) * scale))
+            for b in BUILDINGS
+        ]
+
+    def point(self, x, y):
+        """Scale a tile position from the 80x80 design, e.g. a warp from ModEntry."""
+        return (self.cx + round((x - CX) * self.scale),
+                self.cy + round((y - CY) * self.scale))
+
+
+def zone_grid(layout, y0=0, y1=None):
+    """Zone masks for map rows y0..y1 (default: the whole map) as 2-D arrays."""
+    y1 = layout.height if y1 is None else y1
+    y, x = np.mgrid[y0:y1, 0:layout.width]
+    dist = np.sqrt((x - layout.cx) ** 2 + (y - layout.cy) ** 2)
+
+    water = dist > layout.water_min
+    beach = ~water & (dist > layout.beach_min)
+    forest = ~water & ~beach & (dist > layout.forest_min)
+    town = ~(water | beach | forest)
+
+    on_cross = np.isin(x, layout.path) | np.isin(y, layout.path_rows)
+    on_dock_rows = (y >= layout.dock_y[0]) & (y <= layout.dock_y[1])
+    # Small south-facing pier like Ginger Island — 2 tiles wide, extends from beach into water
+    dock = np.isin(x, layout.path) & on_dock_rows
+    dock_sides = (layout.path[0] - 1, layout.path[1] + 1)
+    plaza = (np.abs(x - layout.cx) <= layout.plaza_half) & (np.abs(y - layout.cy) <= layout.plaza_half)
+
+    return {
+        "x": x,
+        "y": y,
+        "dist": dist,
+        "water": water,
+        "beach": beach,
+        "forest": forest,
+        "town": town,
+        "path": forest & on_cross,  # N/S and E/W paths through the forest
+        "plaza": town & plaza,
+        "town_path": town & on_cross,
+        "dock": dock,
+        "dock_edge": water & ~dock & np.isin(x, dock_sides) & on_dock_rows,
+    }
+
+
+def _pick(tiles, x, y):
+    """Deterministic per-cell variation: tiles[((x * 7 + y * 13) % 100) % len(tiles)]."""
+    h = (x * 7 + y * 13) % 100
+    return np.asarray(tiles)[h % len(tiles)]
 
 
 def dock_tile(x, y):
     """Pick a wooden dock plank tile."""
-    h = (x * 7 + y * 13) % 100
-    return DOCK_PLANKS[h % len(DOCK_PLANKS)]
+    return _pick(DOCK_PLANKS, x, y)
 
 
 def ocean_tile(x, y):
     """Pick a tropical island ocean tile."""
-    h = (x * 7 + y * 13) % 100
-    return ISLAND_OCEAN[h % len(ISLAND_OCEAN)]
+    return _pick(ISLAND_OCEAN, x, y)
 
 
 def beach_tile(x, y):
     """Pick a dry sand beach tile."""
-    h = (x * 7 + y * 13) % 100  # deterministic variation
-    return DRY_SAND[h % len(DRY_SAND)]
+    return _pick(DRY_SAND, x, y)
 
 
 # === Building definitions ===
@@ -178,11 +230,11 @@ TENT_PADS = [
 
 
 
-def get_building_tiles():
+def get_building_tiles(layout):
     """Pre-compute building tile positions."""
     building_cells = {}  # (x, y) -> {"back": gid, "buildings": gid, "front": gid}
 
-    for b in BUILDINGS:
+    for b in layout.buildings:
         bx, by, bw, bh = b["x"], b["y"], b["w"], b["h"]
         door_x = bx + bw // 2
 
@@ -192,15 +244,15 @@ def get_building_tiles():
                 cell = {"back": COBBLE, "buildings": 0, "front": 0}
 
                 if dy < 2:
-                    cell["front"] = town_gid(dy, dx % 5)
+                    cell["front"] = TOWN.gid(dy, dx % 5)
                 is_door = (dy == bh - 1 and mx == door_x)
                 if not is_door:
-                    cell["buildings"] = town_gid(6 + dy, dx % 5)
+                    cell["buildings"] = TOWN.gid(6 + dy, dx % 5)
 
                 building_cells[(mx, my)] = cell
 
     # Tent pads: cobblestone ground only (tent sprite drawn by PermanentTent)
-    for pad in TENT_PADS:
+    for pad in layout.tent_pads:
         for dy in range(pad["h"]):
             for dx in range(pad["w"]):
                 mx, my = pad["x"] + dx, pad["y"] + dy
@@ -209,151 +261,171 @@ def get_building_tiles():
     return building_cells
 
 
-def generate_layers():
-    building_cells = get_building_tiles()
-    back = []
-    buildings = []
-    front = []
-
-    for y in range(HEIGHT):
-        back_row = []
-        buildings_row = []
-        front_row = []
-
-        for x in range(WIDTH):
-            zone = get_zone(x, y)
-            on_path = is_ns_path(x, y) or is_ew_path(x, y)
-            on_dock = is_dock(x, y)
-            on_plaza = is_plaza(x, y)
-            on_town_path = is_town_path(x, y)
-            in_building = (x, y) in building_cells
-
-            # Back layer
-            if in_building:
-                back_row.append(building_cells[(x, y)]["back"])
-            elif on_dock:
-                back_row.append(dock_tile(x, y))
-            elif zone == "water":
-                back_row.append(ocean_tile(x, y))
-            elif zone == "beach":
-                back_row.append(beach_tile(x, y))
-            elif zone == "forest":
-                back_row.append(COBBLE if on_path else GRASS)
-            else:  # town
-                if on_plaza or on_town_path:
-                    back_row.append(COBBLE)
-                else:
-                    back_row.append(GRASS)
-
-            # Buildings layer — block movement in deep water and dock edges
-            dock_edge = (
-                zone == "water" and not on_dock
-                and x in (38, 41) and 65 <= y <= 70
-            )
-            if in_building:
-                buildings_row.append(building_cells[(x, y)]["buildings"])
-            elif on_dock:
-                buildings_row.append(0)
-            elif dock_edge or (zone == "water" and get_dist(x, y) > 32):
-                buildings_row.append(ocean_tile(x, y))
-            else:
-                buildings_row.append(0)
-
-            # Front layer
-            if in_building:
-                front_row.append(building_cells[(x, y)]["front"])
-            else:
-                front_row.append(0)
-
-        back.append(back_row)
-        buildings.append(buildings_row)
-        front.append(front_row)
-
-    return back, buildings, front
-
-
-def layer_to_csv(layer):
-    lines = []
-    for i, row in enumerate(layer):
-        line = ",".join(str(t) for t in row)
-        if i < len(layer) - 1:
-            line += ","
-        lines.append(line)
-    return "\n".join(lines)
-
-
-def generate_tmx():
-    back, buildings, front = generate_layers()
-
-    # Build Water property entries for beach ocean tiles
-    beach_water_props = "\n".join(
-        f'  <tile id="{tid}">\n'
-        f'   <properties>\n'
-        f'    <property name="Water" value="T"/>\n'
-        f'   </properties>\n'
-        f'  </tile>'
-        for tid in BEACH_WATER_TILE_IDS
+def building_grids(layout, building_cells, y0, y1):
+    """Building mask and Back/Buildings/Front GIDs for map rows y0..y1."""
+    shape = (y1 - y0, layout.width)
+    in_building = np.zeros(shape, dtype=bool)
+    building_back = np.zeros(shape, dtype=np.uint32)
+    building_mid = np.zeros(shape, dtype=np.uint32)
+    building_front = np.zeros(shape, dtype=np.uint32)
+    for (bx, by), cell in building_cells.items():
+        if y0 <= by < y1 and 0 <= bx < layout.width:
+            in_building[by - y0, bx] = True
+            building_back[by - y0, bx] = cell["back"]
+            building_mid[by - y0, bx] = cell["buildings"]
+            building_front[by - y0, bx] = cell["front"]
+    return in_building, building_back, building_mid, building_front
+
+
+def generate_band(layout, building_cells, y0, y1):
+    """Back, Buildings and Front arrays for map rows y0..y1."""
+    z = zone_grid(layout, y0, y1)
+    x, y = z["x"], z["y"]
+    in_building, building_back, building_mid, building_front = \
+        building_grids(layout, building_cells, y0, y1)
+
+    # Back layer
+    back = np.select(
+        [in_building, z["dock"], z["water"], z["beach"],
+         z["path"] | z["plaza"] | z["town_path"]],
+        [building_back, dock_tile(x, y), ocean_tile(x, y), beach_tile(x, y), COBBLE],
+        default=GRASS,
     )
 
-    # Build Water property entries for island ocean tiles
-    island_water_props = "\n".join(
-        f'  <tile id="{tid}">\n'
-        f'   <properties>\n'
-        f'    <property name="Water" value="T"/>\n'
-        f'   </properties>\n'
-        f'  </tile>'
-        for tid in ISLAND_WATER_TILE_IDS
+    # Buildings layer — block movement in deep water and dock edges
+    buildings = np.select(
+        [in_building, z["dock"], z["dock_edge"] | (z["water"] & (z["dist"] > layout.deep_water_min))],
+        [building_mid, 0, ocean_tile(x, y)],
+        default=0,
     )
 
-    tmx = f'''<?xml version="1.0" encoding="UTF-8"?>
-<map version="1.10" tiledversion="1.11.0" orientation="orthogonal" renderorder="right-down" width="{WIDTH}" height="{HEIGHT}" tilewidth="16" tileheight="16" infinite="0" nextlayerid="4" nextobjectid="1">
- <tileset firstgid="{OUT_FIRSTGID}" name="outdoors" tilewidth="16" tileheight="16" tilecount="1975" columns="25">
-  <image source="Maps/spring_outdoorsTileSheet.png" width="400" height="1264"/>
- </tileset>
- <tileset firstgid="{BEACH_FIRSTGID}" name="z_beach" tilewidth="16" tileheight="16" tilecount="527" columns="17">
-  <image source="Maps/spring_beach.png" width="272" height="496"/>
-{beach_water_props}
- </tileset>
- <tileset firstgid="{TOWN_FIRSTGID}" name="z_town" tilewidth="16" tileheight="16" tilecount="2304" columns="32">
-  <image source="Maps/spring_town.png" width="512" height="1152"/>
- </tileset>
- <tileset firstgid="{ISLAND_FIRSTGID}" name="z_island" tilewidth="16" tileheight="16" tilecount="2080" columns="32">
-  <image source="Maps/island_tilesheet_1.png" width="512" height="1040"/>
-{island_water_props}
- </tileset>
- <layer id="1" name="Back" width="{WIDTH}" height="{HEIGHT}">
-  <data encoding="csv">
-{layer_to_csv(back)}
-</data>
- </layer>
- <layer id="2" name="Buildings" width="{WIDTH}" height="{HEIGHT}">
-  <data encoding="csv">
-{layer_to_csv(buildings)}
-</data>
- </layer>
- <layer id="3" name="Front" width="{WIDTH}" height="{HEIGHT}">
-  <data encoding="csv">
-{layer_to_csv(front)}
-</data>
- </layer>
-</map>
-'''
-    return tmx
+    # Front layer
+    front = np.where(in_building, building_front, 0)
+
+    return back.astype(np.uint32), buildings.astype(np.uint32), front.astype(np.uint32)
+
+
+def iter_bands(layout, band_rows=BAND_ROWS):
+    """Yield (y0, back, buildings, front) for successive bands of map rows."""
+    building_cells = get_building_tiles(layout)
+    for y0 in range(0, layout.height, band_rows):
+        y1 = min(y0 + band_rows, layout.height)
+        yield (y0,) + generate_band(layout, building_cells, y0, y1)
+
+
+def generate_layers(layout=None):
+    """Whole-map Back, Buildings and Front arrays."""
+    layout = layout or IslandLayout()
+    bands = list(iter_bands(layout))
+    return tuple(np.concatenate([band[i] for band in bands]) for i in (1, 2, 3))
+
+
+def spawn_masks(layout, building_cells, y0, y1):
+    """Cells where the mod may spawn things, per zone, for map rows y0..y1.
+
+    Forest trees avoid the paths; beach forageables avoid the dock; town
+    forageables keep to the TOWN_SPAWN ring off the paths and plaza. Tent
+    pads and buildings are excluded everywhere.
+    """
+    z = zone_grid(layout, y0, y1)
+    free = ~building_grids(layout, building_cells, y0, y1)[0]
+    ring = (z["dist"] > layout.town_spawn[0]) & (z["dist"] <= layout.town_spawn[1])
+    return {
+        "forest": z["forest"] & ~z["path"] & free,
+        "beach": z["beach"] & ~z["dock"] & free,
+        "town": z["town"] & ring & ~z["town_path"] & ~z["plaza"] & free,
+    }
+
+
+def spawn_tables(layout=None, band_rows=BAND_ROWS):
+    """{zone: (n, 2) int32 array of x, y} of spawn cells, in row-major order."""
+    layout = layout or IslandLayout()
+    building_cells = get_building_tiles(layout)
+    cells = {}
+    for y0 in range(0, layout.height, band_rows):
+        y1 = min(y0 + band_rows, layout.height)
+        for zone, mask in spawn_masks(layout, building_cells, y0, y1).items():
+            ys, xs = np.nonzero(mask)
+            cells.setdefault(zone, []).append(np.stack([xs, ys + y0], axis=1).astype(np.int32))
+    return {zone: np.concatenate(parts) for zone, parts in cells.items()}
+
+
+def write_spawn_tables(f, layout=None):
+    """Write spawn_tables() as JSON: each zone is a flat [x0, y0, x1, y1, ...] list."""
+    layout = layout or IslandLayout()
+    tables = {"width": layout.width, "height": layout.height}
+    tables.update((zone, cells.ravel().tolist()) for zone, cells in spawn_tables(layout).items())
+    json.dump(tables, f, separators=(",", ":"))
+    f.write("\n")
+
+
+def island_map(layout=None):
+    """The island's TileMap: tilesheets and size, with layers left to stream in bands."""
+    layout = layout or IslandLayout()
+    return TileMap("RaccoonIsland", layout.width, layout.height, TILESETS)
+
+
+def island_bands(layout, band_rows=BAND_ROWS):
+    """(Back, Buildings, Front) row bands, in the form TileMap.write streams."""
+    return (layers for _, *layers in iter_bands(layout, band_rows))
+
+
+def write_tmx(f, layout=None, band_rows=BAND_ROWS, encoding="csv", compression=None):
+    """Stream the map to an open text file, one row band at a time.
+
+    Each band is generated once, so peak memory is a few bands no matter
+    how large the island is.
+    """
+    layout = layout or IslandLayout()
+    island_map(layout).write(f, encoding, compression, bands=island_bands(layout, band_rows))
+
+
+def generate_tmx(layout=None, encoding="csv", compression=None):
+    """The whole map as one TMX string (see write_tmx for streaming)."""
+    buf = io.StringIO()
+    write_tmx(buf, layout, encoding=encoding, compression=compression)
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
-    tmx_content = generate_tmx()
-    output_path = "assets/RaccoonIsland.tmx"
-    with open(output_path, "w") as f:
-        f.write(tmx_content)
-    print(f"Generated {output_path} ({WIDTH}x{HEIGHT})")
-
-    counts = {"water": 0, "beach": 0, "forest": 0, "town": 0}
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            counts[get_zone(x, y)] += 1
+    parser = argparse.ArgumentParser(description="Generate the Raccoon Island TMX map.")
+    parser.add_argument("--size", type=int, help="square map size in tiles (default: 80)")
+    parser.add_argument("--width", type=int, default=WIDTH)
+    parser.add_argument("--height", type=int, default=HEIGHT)
+    parser.add_argument("--water-min", type=float, help="water ring radius (default: scaled 27)")
+    parser.add_argument("--beach-min", type=float, help="beach ring radius (default: scaled 22)")
+    parser.add_argument("--forest-min", type=float, help="forest ring radius (default: scaled 14)")
+    parser.add_argument("-o", "--output", default="assets/RaccoonIsland.tmx")
+    add_encoding_args(parser)
+    parser.add_argument("--tbin", action="store_true",
+                        help="also write the map as TBIN next to the TMX")
+    args = parser.parse_args()
+    check_encoding_args(parser, args)
+
+    width, height = (args.size, args.size) if args.size else (args.width, args.height)
+    layout = IslandLayout(width, height, args.water_min, args.beach_min, args.forest_min)
+
+    output_path = args.output
+    with open(output_path, "w", buffering=1 << 20) as f:
+        write_tmx(f, layout, encoding=args.encoding, compression=args.compression)
+    print(f"Generated {output_path} ({layout.width}x{layout.height})")
+    spawns_path = os.path.splitext(output_path)[0] + ".spawns.json"
+    with open(spawns_path, "w") as f:
+        write_spawn_tables(f, layout)
+    print(f"Generated {spawns_path}")
+    if args.tbin:
+        tbin_path = os.path.splitext(output_path)[0] + ".tbin"
+        with open(tbin_path, "wb", buffering=1 << 20) as f:
+            write_tbin(f, island_map(layout), island_bands(layout))
+        print(f"Generated {tbin_path}")
+
+    counts = dict.fromkeys(("water", "beach", "forest", "town"), 0)
+    for y0 in range(0, layout.height, BAND_ROWS):
+        zones = zone_grid(layout, y0, min(y0 + BAND_ROWS, layout.height))
+        for name in counts:
+            counts[name] += int(zones[name].sum())
     print(f"Zone stats: {counts}")
 
-    building_count = sum(1 for b in BUILDINGS for dy in range(b["h"]) for dx in range(b["w"]))
+    building_count = sum(1 for b in layout.buildings for dy in range(b["h"]) for dx in range(b["w"]))
     print(f"Building tiles: {building_count}")
     print("Forest trees: spawned as TerrainFeature objects in ModEntry.cs")
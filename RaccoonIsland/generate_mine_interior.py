@@ -3,95 +3,57 @@
 Uses Maps/townInterior.png tilesheet (32 cols x 68 rows).
 Exit warp tiles at (7,11) and (8,11) — bottom-center.
 """
+import argparse
 
-TI_FIRSTGID = 1
-TI_COLS = 32
+from tbin import write_tbin
+from tilesets import Tileset, TilesetRegistry
+from tmx import TileMap, add_encoding_args, check_encoding_args
 
-def ti_gid(row, col):
-    return TI_FIRSTGID + row * TI_COLS + col
+TILESETS = TilesetRegistry()
+TOWN_INTERIOR = TILESETS.add(Tileset.from_image(
+    "townInterior", "Maps/townInterior.png", size=(512, 1088)))
 
-STONE_FLOOR = ti_gid(22, 0)   # dark stone floor
-WALL_TILE = ti_gid(0, 0)      # interior wall
-WALL_TOP = ti_gid(1, 0)       # upper wall decoration
+STONE_FLOOR = TOWN_INTERIOR.gid(22, 0)   # dark stone floor
+WALL_TILE = TOWN_INTERIOR.gid(0, 0)      # interior wall
+WALL_TOP = TOWN_INTERIOR.gid(1, 0)       # upper wall decoration
 
 WIDTH = 16
 HEIGHT = 12
 
 
-def generate_layers():
-    back = []
-    buildings = []
-    front = []
+def generate_map():
+    tile_map = TileMap("RaccoonMine", WIDTH, HEIGHT, TILESETS)
 
-    for y in range(HEIGHT):
-        back_row = []
-        buildings_row = []
-        front_row = []
+    tile_map.layer("Back")[:] = STONE_FLOOR
 
-        for x in range(WIDTH):
-            is_perimeter = (x == 0 or x == WIDTH - 1 or y == 0 or y == HEIGHT - 1)
-            is_exit = (y == HEIGHT - 1 and x in (7, 8))
+    # Walls on the perimeter, with a gap for the exit
+    buildings = tile_map.layer("Buildings")
+    buildings[[0, -1], :] = WALL_TILE
+    buildings[:, [0, -1]] = WALL_TILE
+    buildings[-1, 7:9] = 0
 
-            back_row.append(STONE_FLOOR)
+    tile_map.layer("Front")[0, 1:-1] = WALL_TOP
+    return tile_map
 
-            if is_perimeter and not is_exit:
-                buildings_row.append(WALL_TILE)
-            else:
-                buildings_row.append(0)
 
-            if y == 0 and 0 < x < WIDTH - 1:
-                front_row.append(WALL_TOP)
-            else:
-                front_row.append(0)
-
-        back.append(back_row)
-        buildings.append(buildings_row)
-        front.append(front_row)
-
-    return back, buildings, front
-
-
-def layer_to_csv(layer):
-    lines = []
-    for i, row in enumerate(layer):
-        line = ",".join(str(t) for t in row)
-        if i < len(layer) - 1:
-            line += ","
-        lines.append(line)
-    return "\n".join(lines)
-
-
-def generate_tmx():
-    back, buildings, front = generate_layers()
-
-    tmx = f'''<?xml version="1.0" encoding="UTF-8"?>
-<map version="1.10" tiledversion="1.11.0" orientation="orthogonal" renderorder="right-down" width="{WIDTH}" height="{HEIGHT}" tilewidth="16" tileheight="16" infinite="0" nextlayerid="4" nextobjectid="1">
- <tileset firstgid="{TI_FIRSTGID}" name="townInterior" tilewidth="16" tileheight="16" tilecount="2176" columns="32">
-  <image source="Maps/townInterior.png" width="512" height="1088"/>
- </tileset>
- <layer id="1" name="Back" width="{WIDTH}" height="{HEIGHT}">
-  <data encoding="csv">
-{layer_to_csv(back)}
-</data>
- </layer>
- <layer id="2" name="Buildings" width="{WIDTH}" height="{HEIGHT}">
-  <data encoding="csv">
-{layer_to_csv(buildings)}
-</data>
- </layer>
- <layer id="3" name="Front" width="{WIDTH}" height="{HEIGHT}">
-  <data encoding="csv">
-{layer_to_csv(front)}
-</data>
- </layer>
-</map>
-'''
-    return tmx
+def generate_tmx(encoding="csv", compression=None):
+    return generate_map().tostring(encoding, compression)
 
 
 if __name__ == "__main__":
-    tmx_content = generate_tmx()
+    parser = argparse.ArgumentParser(description="Generate the Raccoon mine interior TMX map.")
+    add_encoding_args(parser)
+    parser.add_argument("--tbin", action="store_true", help="also write the map as TBIN")
+    args = parser.parse_args()
+    check_encoding_args(parser, args)
+
+    tmx_content = generate_tmx(args.encoding, args.compression)
     output_path = "assets/RaccoonMine.tmx"
     with open(output_path, "w") as f:
         f.write(tmx_content)
     print(f"Generated {output_path} ({WIDTH}x{HEIGHT})")
+    if args.tbin:
+        output_path = "assets/RaccoonMine.tbin"
+        with open(output_path, "wb") as f:
+            write_tbin(f, generate_map())
+        print(f"Generated {output_path}")
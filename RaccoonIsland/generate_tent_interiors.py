@@ -3,38 +3,39 @@
 
 12x12 tile map with 3 tilesheets + nest_tiles, copied directly from
 the extracted FarmHouse.xnb tile data.
+
+The FarmHouse copy is a shared tmx.MapTemplate, formatted once; each tent
+is a sparse patch over it (TENT_PATCHES), and tents with the same patch
+share one serialized map.
 """
+import argparse
+import io
+
+from tbin import write_tbin
+from tilesets import Tileset, TilesetRegistry
+from tmx import MapTemplate, TileMap, add_encoding_args, check_encoding_args
 
 WIDTH = 12
 HEIGHT = 12
 
-# --- Tilesheet definitions (exact names from vanilla FarmHouse) ---
-
-# indoor (townInterior): 32 cols x 66 rows
-TI_FIRSTGID = 1
-TI_TILES = 2176
-TI_COLS = 32
-
+# --- Tilesheets (exact names from vanilla FarmHouse), in map order ---
+TILESETS = TilesetRegistry()
+# indoor (townInterior): 32 cols x 68 rows
+INDOOR = TILESETS.add(Tileset.from_image("indoor", "Maps/townInterior", size=(512, 1088)))
 # untitled tile sheet (farmhouse_tiles): 12 cols x 20 rows
-FH_FIRSTGID = TI_FIRSTGID + TI_TILES  # 2177
-FH_TILES = 240
-FH_COLS = 12
-
+FARMHOUSE = TILESETS.add(Tileset.from_image(
+    "untitled tile sheet", "Maps/farmhouse_tiles", size=(192, 320)))
 # walls_and_floors: 16 cols x 32 rows
-WF_FIRSTGID = FH_FIRSTGID + FH_TILES  # 2417
-WF_TILES = 512
-WF_COLS = 16
-
-# nest_tiles: 3 cols x 2 rows
-NEST_FIRSTGID = WF_FIRSTGID + WF_TILES  # 2929
-NEST_COLS = 3
-NEST_TILES = 6
+WALLS_FLOORS = TILESETS.add(Tileset.from_image(
+    "walls_and_floors", "Maps/walls_and_floors", size=(256, 512)))
+# nest_tiles: 3 cols x 2 rows, drawn from sprites/nest_tiles.json
+NEST = TILESETS.add(Tileset.from_image("nest", "nest_tiles.png", size=(48, 32)))
 
 
-def I(n): return TI_FIRSTGID + n   # indoor / townInterior
-def F(n): return FH_FIRSTGID + n   # farmhouse_tiles
-def W(n): return WF_FIRSTGID + n   # walls_and_floors
-E = 0                               # empty (no tile)
+def I(n): return INDOOR.gid(n)         # indoor / townInterior
+def F(n): return FARMHOUSE.gid(n)      # farmhouse_tiles
+def W(n): return WALLS_FLOORS.gid(n)   # walls_and_floors
+E = 0                                  # empty (no tile)
 
 
 # === Exact tile data from vanilla FarmHouse.xnb ===
@@ -121,64 +122,57 @@ FRONT = [
 ]
 
 
+def base_interior():
+    """The shared FarmHouse layout, before any per-tent patch."""
+    tile_map = TileMap("TentInterior", WIDTH, HEIGHT, TILESETS)
+    tile_map.set_layer("Back", BACK)
+    tile_map.set_layer("Buildings", BUILDINGS)
+    tile_map.set_layer("Front", FRONT)
+    return tile_map
+
+
+def stamp(tileset, x, y):
+    """Patch cells placing a whole tileset, tile by tile, with its top-left at (x, y)."""
+    return {(x + col, y + row): tileset.gid(row, col)
+            for row in range(tileset.rows) for col in range(tileset.columns)}
+
+
+# Raccoon nest (3x2) on the floor at the upper right of the walkable area
+NEST_PATCH = {"Buildings": stamp(NEST, 8, 5)}
+
+TENT_NAMES = [f"TentInterior{i:02d}" for i in range(1, 13)]
+# Per-tent cell overrides on top of the base layout
+TENT_PATCHES = {name: NEST_PATCH for name in TENT_NAMES}
+
+TEMPLATE = MapTemplate(base_interior())
+
+
 def generate_interior(name):
-    import copy
-    back = copy.deepcopy(BACK)
-    buildings = copy.deepcopy(BUILDINGS)
-    front = copy.deepcopy(FRONT)
-
-    # Place raccoon nest (3x2) on floor at upper-right of walkable area
-    for dy in range(2):
-        for dx in range(3):
-            buildings[5 + dy][8 + dx] = NEST_FIRSTGID + dy * NEST_COLS + dx
-
-    def csv(layer):
-        lines = []
-        for i, row in enumerate(layer):
-            line = ",".join(str(t) for t in row)
-            if i < len(layer) - 1:
-                line += ","
-            lines.append(line)
-        return "\n".join(lines)
-
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<map version="1.10" tiledversion="1.11.0" orientation="orthogonal" renderorder="right-down" width="{WIDTH}" height="{HEIGHT}" tilewidth="16" tileheight="16" infinite="0" nextlayerid="4" nextobjectid="1">
- <tileset firstgid="{TI_FIRSTGID}" name="indoor" tilewidth="16" tileheight="16" tilecount="{TI_TILES}" columns="{TI_COLS}">
-  <image source="Maps/townInterior" width="512" height="1088"/>
- </tileset>
- <tileset firstgid="{FH_FIRSTGID}" name="untitled tile sheet" tilewidth="16" tileheight="16" tilecount="{FH_TILES}" columns="{FH_COLS}">
-  <image source="Maps/farmhouse_tiles" width="192" height="320"/>
- </tileset>
- <tileset firstgid="{WF_FIRSTGID}" name="walls_and_floors" tilewidth="16" tileheight="16" tilecount="{WF_TILES}" columns="{WF_COLS}">
-  <image source="Maps/walls_and_floors" width="256" height="512"/>
- </tileset>
- <tileset firstgid="{NEST_FIRSTGID}" name="nest" tilewidth="16" tileheight="16" tilecount="{NEST_TILES}" columns="{NEST_COLS}">
-  <image source="nest_tiles.png" width="48" height="32"/>
- </tileset>
- <layer id="1" name="Back" width="{WIDTH}" height="{HEIGHT}">
-  <data encoding="csv">
-{csv(back)}
-</data>
- </layer>
- <layer id="2" name="Buildings" width="{WIDTH}" height="{HEIGHT}">
-  <data encoding="csv">
-{csv(buildings)}
-</data>
- </layer>
- <layer id="3" name="Front" width="{WIDTH}" height="{HEIGHT}">
-  <data encoding="csv">
-{csv(front)}
-</data>
- </layer>
-</map>
-'''
+    return TEMPLATE.instance(TENT_PATCHES[name], name)
 
 
 if __name__ == "__main__":
-    for i in range(1, 13):
-        name = f"TentInterior{i:02d}"
-        content = generate_interior(name)
+    parser = argparse.ArgumentParser(description="Generate tent interior TMX maps.")
+    add_encoding_args(parser)
+    parser.add_argument("--tbin", action="store_true", help="also write the maps as TBIN")
+    args = parser.parse_args()
+    check_encoding_args(parser, args)
+
+    template = MapTemplate(TEMPLATE.tile_map, args.encoding, args.compression)
+    tbin_cache = {}
+    for name in TENT_NAMES:
+        patch = TENT_PATCHES[name]
         path = f"assets/{name}.tmx"
         with open(path, "w") as f:
-            f.write(content)
+            f.write(template.render(patch))
         print(f"Generated {path} ({WIDTH}x{HEIGHT})")
+        if args.tbin:
+            key = template.key(patch)
+            if key not in tbin_cache:
+                buf = io.BytesIO()
+                write_tbin(buf, template.instance(patch))
+                tbin_cache[key] = buf.getvalue()
+            path = f"assets/{name}.tbin"
+            with open(path, "wb") as f:
+                f.write(tbin_cache[key])
+            print(f"Generated {path}")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Place the island's forest trees with Poisson-disk sampling.
+
+Trees go on the forest spawn cells from generate_map.spawn_tables (the
+forest ring minus the N/S and E/W paths), no two closer than RADIUS tiles.
+At RADIUS 3 every tree keeps the 8 tiles around it free, which fruit trees
+need to grow.
+
+Sampling follows Bridson's scheme: a background grid with cells of
+RADIUS / sqrt(2), so a cell holds at most one tree, and up to ATTEMPTS
+tries per cell. Each placed tree stamps the tiles within RADIUS as
+blocked, so testing a candidate is one lookup. The grid cells are split
+into 9 phases by (cell x mod 3, cell y mod 3); cells in the same phase are
+more than RADIUS apart, so a phase tries one random forest tile in all of
+its open cells at once as array operations. Phases run in a seeded
+random order each round, so the result is deterministic per seed with no
+raster-order bias, and cells with no free tile left drop out.
+
+Types are dealt out evenly from TREE_TYPES and shuffled over the trees.
+The output is JSON that ModEntry.SpawnForestTrees reads:
+
+    {"width": 80, "height": 80, "seed": 0, "radius": 3,
+     "types": ["1", "2", ...], "trees": [x0, y0, t0, x1, y1, t1, ...]}
+
+where each t indexes into "types".
+
+Usage:
+    python generate_trees.py [--seed N] [--size 2000 -o assets/RaccoonIslandXL.trees.json]
+"""
+import argparse
+import json
+import math
+import time
+
+import numpy as np
+
+from generate_map import HEIGHT, WIDTH, IslandLayout, spawn_tables
+
+RADIUS = 3
+ATTEMPTS = 30
+# Wild: oak(1), maple(2), pine(3), coconut palm(6)
+# Fruit: pomegranate(632), apple(633), orange(630), cherry(628), apricot(629)
+TREE_TYPES = ["1", "2", "3", "6", "632", "633", "630", "628", "629"]
+
+
+def poisson_disk(cells, radius=RADIUS, attempts=ATTEMPTS, seed=0):
+    """Indices into `cells` ((n, 2) int x, y) of tiles at least `radius` apart, in row order."""
+    rng = np.random.default_rng(seed)
+    if len(cells) == 0:
+        return np.zeros(0, dtype=np.int64)
+    grid_xy = np.floor(cells / (radius / math.sqrt(2))).astype(np.int64)
+    grid_xy -= grid_xy.min(axis=0)
+    grid_id = grid_xy[:, 1] * (grid_xy[:, 0].max() + 1) + grid_xy[:, 0]
+
+    # Tiles grouped by grid cell: cell i owns order[starts[i]:starts[i] + counts[i]]
+    order = np.argsort(grid_id, kind="stable")
+    ids, starts, counts = np.unique(grid_id[order], return_index=True, return_counts=True)
+    grid_x = grid_xy[order[starts], 0]
+    grid_y = grid_xy[order[starts], 1]
+    phase = grid_x % 3 + 3 * (grid_y % 3)
+
+    # Tiles closer than `radius` to a placed tree are blocked
+    reach = math.ceil(radius)
+    dy, dx = np.mgrid[-reach:reach + 1, -reach:reach + 1]
+    disk = dx ** 2 + dy ** 2 < radius ** 2
+    dx, dy = dx[disk], dy[disk]
+    xy = cells - cells.min(axis=0) + reach
+    blocked = np.zeros((xy[:, 1].max() + reach + 1, xy[:, 0].max() + reach + 1), dtype=bool)
+
+    open_cells = np.ones(len(ids), dtype=bool)  # no tree yet and some tile still free
+    placed = []
+    for _ in range(attempts):
+        for p in rng.permutation(9):
+            todo = np.flatnonzero(open_cells & (phase == p))
+            if not len(todo):
+                continue
+            pick = order[starts[todo] + (rng.random(len(todo)) * counts[todo]).astype(np.int64)]
+            ok = ~blocked[xy[pick, 1], xy[pick, 0]]
+            new = pick[ok]
+            open_cells[todo[ok]] = False
+            blocked[xy[new, 1][:, None] + dy, xy[new, 0][:, None] + dx] = True
+            placed.append(new)
+        free = ~blocked[xy[order, 1], xy[order, 0]]
+        open_cells &= np.add.reduceat(free, starts) > 0
+        if not open_cells.any():
+            break
+
+    placed = np.concatenate(placed) if placed else np.zeros(0, dtype=np.int64)
+    return placed[np.lexsort((cells[placed, 0], cells[placed, 1]))]
+
+
+def place_trees(layout=None, seed=0, radius=RADIUS, attempts=ATTEMPTS):
+    """(n, 3) int array of x, y and an index into TREE_TYPES for each tree."""
+    layout = layout or IslandLayout()
+    forest = spawn_tables(layout)["forest"].astype(np.int64)
+    chosen = forest[poisson_disk(forest, radius, attempts, seed)]
+    rng = np.random.default_rng(seed + 1)
+    types = rng.permutation(np.resize(np.arange(len(TREE_TYPES)), len(chosen)))
+    return np.column_stack([chosen, types])
+
+
+def write_trees(f, layout, trees, seed=0, radius=RADIUS):
+    json.dump({
+        "width": layout.width,
+        "height": layout.height,
+        "seed": seed,
+        "radius": radius,
+        "types": TREE_TYPES,
+        "trees": trees.ravel().tolist(),
+    }, f, separators=(",", ":"))
+    f.write("\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Place forest trees with Poisson-disk sampling.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--radius", type=float, default=RADIUS,
+                        help=f"minimum distance between trees in tiles (default: {RADIUS})")
+    parser.add_argument("--attempts", type=int, default=ATTEMPTS)
+    parser.add_argument("--size", type=int, help="square map size in tiles (default: 80)")
+    parser.add_argument("--width", type=int, default=WIDTH)
+    parser.add_argument("--height", type=int, default=HEIGHT)
+    parser.add_argument("-o", "--output", default="assets/RaccoonIsland.trees.json")
+    args = parser.parse_args()
+
+    width, height = (args.size, args.size) if args.size else (args.width, args.height)
+    layout = IslandLayout(width, height)
+    began = time.perf_counter()
+    trees = place_trees(layout, args.seed, args.radius, args.attempts)
+    elapsed = time.perf_counter() - began
+    with open(args.output, "w") as f:
+        write_trees(f, layout, trees, args.seed, args.radius)
+    print(f"Generated {args.output} ({len(trees)} trees, {elapsed * 1000:.0f} ms)")
@@ -0,0 +1,140 @@
+"""Drawing primitives for the sprite generators, over NumPy RGBA canvases.
+
+A canvas is a (height, width, 4) uint8 array. Shape functions return a
+boolean mask over the canvas, computed for every pixel at once from
+np.ogrid coordinates, and the paint functions write a colour (or one
+colour per pixel) where a mask is set. Masks combine with & | ~, so a
+sprite is a handful of array operations instead of a putpixel per pixel.
+
+A canvas can also be a (height, width) array of palette indices (see
+render_sprites.py); the paint functions then take an index wherever they
+take a colour.
+
+Shape tests keep the arithmetic of the per-pixel loops they replace (the
+same float64 operations in the same order), so ported sprites come out
+pixel-identical. Regions are half-open like range(): x0 <= x < x1.
+
+    img = raster.new(48, 32)
+    outer = raster.ellipse(img, 24.0, 16.0, 22.0, 14.0)
+    raster.texture(img, outer, TWIG, [((1, 1, 3), TWIG_DK), ((7, 1, 9), TWIG_LT)])
+    raster.save(img, "assets/nest_tiles.png")
+"""
+import numpy as np
+
+
+def new(width, height):
+    """A transparent canvas."""
+    return np.zeros((height, width, 4), dtype=np.uint8)
+
+
+def save(canvas, path):
+    from PIL import Image
+
+    Image.fromarray(canvas, "RGBA").save(path)
+
+
+def coords(canvas):
+    """(y, x) pixel coordinates that broadcast to the canvas: shapes (h, 1) and (1, w)."""
+    height, width = canvas.shape[:2]
+    return np.ogrid[:height, :width]
+
+
+# --- Shapes (boolean masks) ---
+
+def box(canvas, x0, y0, x1, y1):
+    """Pixels with x0 <= x < x1 and y0 <= y < y1."""
+    y, x = coords(canvas)
+    return (x0 <= x) & (x < x1) & (y0 <= y) & (y < y1)
+
+
+def ellipse(canvas, cx, cy, rx, ry, limit=1.0):
+    """Pixels inside the ellipse: ((x - cx) / rx)**2 + ((y - cy) / ry)**2 <= limit."""
+    y, x = coords(canvas)
+    dx = (x - cx) / rx
+    dy = (y - cy) / ry
+    return dx * dx + dy * dy <= limit
+
+
+def ring(canvas, cx, cy, outer, inner):
+    """Pixels inside the ellipse with radii `outer` but not the one with radii `inner`."""
+    return ellipse(canvas, cx, cy, *outer) & ~ellipse(canvas, cx, cy, *inner)
+
+
+def taper(canvas, y0, cx, half_widths):
+    """A shape of rows y0, y0 + 1, ... centred on cx, with |x - cx| <= half_widths[row]."""
+    y, x = coords(canvas)
+    rows = np.full(len(y), -1.0)  # rows outside the shape match nothing
+    half_widths = np.asarray(half_widths, dtype=np.float64)[:max(len(y) - y0, 0)]
+    rows[y0:y0 + len(half_widths)] = half_widths
+    return np.abs(x - cx) <= rows[:, None]
+
+
+def pattern(canvas, a, b, modulus, remainder=0):
+    """Pixels with (a * x + b * y) % modulus == remainder, for dithering and texture."""
+    y, x = coords(canvas)
+    return (a * x + b * y) % modulus == remainder
+
+
+# --- Paint ---
+
+def fill(canvas, mask, color):
+    """Set the pixels in `mask` to `color`: one RGBA tuple, or an array of
+    colours that broadcasts to the canvas (one per row, column or pixel)."""
+    mask = np.broadcast_to(mask, canvas.shape[:2])
+    color = np.asarray(color, dtype=np.uint8)
+    if color.ndim == canvas.ndim - 2:
+        canvas[mask] = color
+    else:
+        canvas[mask] = np.broadcast_to(color, canvas.shape)[mask]
+
+
+def rect(canvas, x0, y0, x1, y1, color):
+    canvas[max(y0, 0):max(y1, 0), max(x0, 0):max(x1, 0)] = color
+
+
+def put(canvas, points, color):
+    """Set single pixels, given as (x, y) pairs."""
+    points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+    canvas[points[:, 1], points[:, 0]] = color
+
+
+def texture(canvas, mask, base, patterns):
+    """Fill `mask` with `base`, overlaid with ((a, b, modulus), color) patterns.
+
+    Earlier patterns win where they overlap, like an if/elif chain.
+    """
+    fill(canvas, mask, base)
+    for (a, b, modulus), color in reversed(patterns):
+        fill(canvas, mask & pattern(canvas, a, b, modulus), color)
+
+
+def gradient(canvas, mask, t, thresholds, colors):
+    """Fill `mask` with colour bands of `t`: colors[0] where t < thresholds[0],
+    colors[i] where thresholds[i - 1] <= t < thresholds[i], and colors[-1] above.
+
+    `t` is any array that broadcasts to the canvas, e.g. a function of x.
+    """
+    palette = np.asarray(colors, dtype=np.uint8)
+    fill(canvas, mask, palette[np.searchsorted(thresholds, t, side="right")])
+
+
+def column_gradient(canvas, x0, y0, x1, y1, thresholds, colors):
+    """Fill a rect with bands by column, t running from 0 at x0 to 1 at x1 - 1."""
+    y, x = coords(canvas)
+    t = (x - x0) / max(x1 - x0 - 1, 1)
+    gradient(canvas, box(canvas, x0, y0, x1, y1), t, thresholds, colors)
+
+
+def stroke(canvas, xs, ys, color, half_width=0):
+    """Draw a horizontal brush 2 * half_width + 1 pixels wide at each (xs[i], ys[i]),
+    clipped to the canvas. `color` is one RGBA tuple or one per point."""
+    xs = np.asarray(xs, dtype=np.int64)
+    ys = np.asarray(ys, dtype=np.int64)
+    color = np.asarray(color, dtype=np.uint8)
+    offsets = np.arange(-half_width, half_width + 1)
+    px = (xs[:, None] + offsets).ravel()
+    py = np.repeat(ys, len(offsets))
+    colors = np.broadcast_to(color, (len(xs), *canvas.shape[2:])).repeat(len(offsets), axis=0)
+    height, width = canvas.shape[:2]
+    inside = (0 <= px) & (px < width) & (0 <= py) & (py < height)
+    canvas[py[inside], px[inside]] = colors[inside]
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Render a TMX map to a PNG preview without starting the game.
+
+Every tileset is looked up by file name among the extracted game sheets
+(extracted_assets/) and the mod's own assets/, and loaded through its
+memory-mapped tile atlas (see tile_atlas.py). The sheets are copied into
+one premultiplied-alpha atlas indexed directly by GID, so a layer is
+rendered with a single fancy-indexing gather, atlas[gids], and composited
+over the layers below it with the "over" operator. Sheets that are not on
+disk render as a flat placeholder colour per tileset.
+
+Maps are rendered in bands of rows, and --tile-size scales tiles down
+(box-filtering the atlas, not the output), so a 2000x2000 island renders
+at a few pixels per tile:
+
+    python render_map.py assets/RaccoonIsland.tmx -o preview.png
+    python render_map.py assets/RaccoonIslandXL.tmx --tile-size 2 -o xl.png
+"""
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+import numpy as np
+
+from tilesets import GAME_SHEETS, TILE_SIZE
+from tmx_reader import read_tmx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from tile_atlas import open_atlas  # noqa: E402
+
+MOD_ASSETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+SEARCH_PATH = [GAME_SHEETS, MOD_ASSETS]
+TILE_SIZES = (1, 2, 4, 8, 16)
+GID_MASK = 0x1FFFFFFF  # Tiled stores flip flags in the top bits
+BAND_ROWS = 64
+
+
+def find_image(image, search_path=SEARCH_PATH):
+    """Path of a tileset image found by file name in `search_path`, or None."""
+    filename = os.path.basename(image)
+    if not filename.endswith(".png"):
+        filename += ".png"
+    for directory in search_path:
+        path = os.path.join(directory, filename)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def placeholder(name, tile_size):
+    """A solid tile in a colour derived from the tileset name, with a darker edge."""
+    rgb = np.frombuffer(hashlib.sha1(name.encode()).digest()[:3], dtype=np.uint8) / 255.0
+    tile = np.empty((tile_size, tile_size, 4), dtype=np.float32)
+    tile[..., :3] = rgb
+    tile[..., 3] = 1.0
+    if tile_size >= 4:
+        tile[0, :, :3] *= 0.6
+        tile[:, 0, :3] *= 0.6
+    return tile
+
+
+def downscale(tiles, tile_size):
+    """Box-filter (n, 16, 16, 4) premultiplied tiles to (n, tile_size, tile_size, 4)."""
+    step = TILE_SIZE // tile_size
+    if step == 1:
+        return tiles
+    n = len(tiles)
+    return tiles.reshape(n, tile_size, step, tile_size, step, 4).mean(axis=(2, 4))
+
+
+def gid_atlas(tilesets, tile_size=TILE_SIZE, search_path=SEARCH_PATH):
+    """(atlas, missing): premultiplied float32 tiles indexed by GID, and the
+    names of tilesets whose image was not found. GID 0 is transparent."""
+    count = max((t.firstgid + t.tilecount for t in tilesets), default=1)
+    atlas = np.zeros((count, tile_size, tile_size, 4), dtype=np.float32)
+    missing = []
+    for tileset in tilesets:
+        first, last = tileset.firstgid, tileset.firstgid + tileset.tilecount
+        path = find_image(tileset.image, search_path)
+        if path is None:
+            atlas[first:last] = placeholder(tileset.name, tile_size)
+            missing.append(tileset.name)
+            continue
+        tiles = np.zeros((tileset.rows, tileset.columns, TILE_SIZE, TILE_SIZE, 4), dtype=np.float32)
+        with open_atlas(path) as sheet:
+            rows, cols = min(tileset.rows, sheet.rows), min(tileset.columns, sheet.cols)
+            tiles[:rows, :cols] = sheet.grid()[:rows, :cols] / np.float32(255)
+        tiles[..., :3] *= tiles[..., 3:]
+        atlas[first:last] = downscale(tiles.reshape(-1, TILE_SIZE, TILE_SIZE, 4), tile_size)
+    return atlas, missing
+
+
+def render_band(atlas, grids):
+    """Composite (rows, width) GID grids, bottom first, into premultiplied pixels."""
+    rows, width = grids[0].shape
+    tile_size = atlas.shape[1]
+    canvas = np.zeros((rows, width, tile_size, tile_size, 4), dtype=np.float32)
+    for grid in grids:
+        gids = grid & GID_MASK
+        gids = np.where(gids < len(atlas), gids, 0)
+        src = atlas[gids]
+        canvas *= 1 - src[..., 3:]
+        canvas += src
+    return canvas.transpose(0, 2, 1, 3, 4).reshape(rows * tile_size, width * tile_size, 4)
+
+
+def render(tile_map, tile_size=TILE_SIZE, layers=None, band_rows=BAND_ROWS,
+           search_path=SEARCH_PATH):
+    """(RGBA uint8 image array, names of tilesets rendered as placeholders)."""
+    if tile_size not in TILE_SIZES:
+        raise ValueError(f"tile size must be one of {TILE_SIZES}")
+    layers = [name for name in (layers or tile_map.layer_names) if name in tile_map.layers]
+    atlas, missing = gid_atlas(list(tile_map.tilesets), tile_size, search_path)
+    image = np.zeros((tile_map.height * tile_size, tile_map.width * tile_size, 4), dtype=np.uint8)
+    for y0 in range(0, tile_map.height, band_rows):
+        y1 = min(y0 + band_rows, tile_map.height)
+        if not layers:
+            break
+        pixels = render_band(atlas, [tile_map.layers[name][y0:y1] for name in layers])
+        alpha = pixels[..., 3:]
+        pixels[..., :3] /= np.where(alpha > 0, alpha, 1)
+        image[y0 * tile_size:y1 * tile_size] = np.rint(pixels * 255).astype(np.uint8)
+    return image, missing
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a TMX map to a PNG preview.")
+    parser.add_argument("map")
+    parser.add_argument("-o", "--output", help="PNG path (default: the map name + .png)")
+    parser.add_argument("--tile-size", type=int, default=TILE_SIZE, choices=TILE_SIZES,
+                        help="pixels per tile (default: 16)")
+    parser.add_argument("--layers", help="comma-separated layers to draw (default: all)")
+    args = parser.parse_args()
+
+    from PIL import Image
+
+    began = time.perf_counter()
+    tile_map = read_tmx(args.map)
+    image, missing = render(tile_map, args.tile_size,
+                            args.layers.split(",") if args.layers else None)
+    output = args.output or os.path.splitext(args.map)[0] + ".png"
+    Image.fromarray(image, "RGBA").save(output)
+    elapsed = time.perf_counter() - began
+    print(f"Rendered {output} ({image.shape[1]}x{image.shape[0]}, {elapsed:.2f}s)")
+    for name in missing:
+        print(f"  tileset {name!r}: image not found, drawn as a placeholder")
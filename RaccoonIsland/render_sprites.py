@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""Render the mod's sprites from declarative specs in sprites/*.json.
+
+A spec names a canvas size, an output path, a palette and a list of
+layers, each a list of shapes drawn in order with raster.py. Other keys,
+in a spec or in an item, such as "description" or "note", are ignored:
+
+    {
+      "size": [16, 16],
+      "output": "assets/mine_entrance.png",
+      "palette": {"STONE": [100, 90, 80, 255], "HOLE": [20, 15, 10, 255]},
+      "let": {"cx": 8},
+      "layers": [
+        {"name": "hole", "draw": [
+          {"rect": [2, 2, 14, 14], "color": "HOLE"},
+          {"ellipse": ["cx", 8, 3, 2], "clip": [0, 0, 16, 8], "color": "STONE"}
+        ]}
+      ],
+      "variants": {"mossy": {"palette": {"STONE": [80, 100, 70, 255]}}}
+    }
+
+Shapes (one per item):
+    "rect": [x0, y0, x1, y1]              half-open, like range()
+    "points": [[x, y], ...]
+    "ellipse": [cx, cy, rx, ry]           optional "limit" (default 1.0)
+    "ring": [cx, cy, rx, ry, rx_in, ry_in]
+    "taper": {"rows": [y0, y1], "cx": cx, "half_width": expr of y}
+    "stroke": {"over": {"y": [start, stop, step]}, "x": expr, "y": expr,
+               "half_width": n}         a brush at each point of a range
+    "where": expr                         any boolean expression of x and y
+
+An item may also narrow its shape with "clip": [x0, y0, x1, y1] and
+"and": expr, and define names for its expressions in "let". It paints
+with one of:
+    "color": name
+    "texture": {"base": name, "patterns": [[a, b, modulus, name], ...]}
+        pixels with (a * x + b * y) % modulus == 0 take the first matching name
+    "gradient": {"t": expr, "stops": [t0, t1, ...], "colors": [name, ...]}
+
+Numbers can be written as expressions: strings of arithmetic over x, y,
+the names in "let" and abs, sqrt, int, where, minimum and maximum, with
+NumPy semantics (x and y are the pixel grid, and in a stroke the "over"
+range replaces one of them). Expressions are checked and compiled when
+the spec is loaded.
+
+A spec is compiled once into palette indices per layer, so rendering it
+again with another palette, or with layers hidden, is a single lookup.
+"variants" in a spec are rendered that way next to its output
+(name_variant.png), and --palette re-renders every sprite with colours
+overridden from a JSON file. Several specs are rendered in parallel
+worker processes, so a batch pays for Python, NumPy and PIL once per
+worker rather than once per sprite.
+
+Usage:
+    python render_sprites.py                          # every sprite
+    python render_sprites.py sprites/raccoon_god.json
+    python render_sprites.py --variants               # also every variant
+    python render_sprites.py --palette night.json -o /tmp/night
+"""
+import argparse
+import ast
+import glob
+import json
+import os
+import time
+import types
+
+import numpy as np
+
+import raster
+
+SPRITE_DIR = "sprites"
+SHAPES = ("rect", "points", "ellipse", "ring", "taper", "where", "stroke")
+PAINTS = ("color", "texture", "gradient")
+FUNCTIONS = {
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "int": lambda a: np.asarray(a).astype(np.int64),  # truncates, like int()
+    "where": np.where,
+    "minimum": np.minimum,
+    "maximum": np.maximum,
+}
+EXPRESSION_NODES = (
+    ast.Expression, ast.Constant, ast.Name, ast.Load, ast.Call,
+    ast.BinOp, ast.UnaryOp, ast.Compare,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.USub, ast.UAdd, ast.Invert, ast.BitAnd, ast.BitOr, ast.BitXor,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+TRANSPARENT = (0, 0, 0, 0)
+
+
+class SpecError(ValueError):
+    pass
+
+
+def compile_expression(text):
+    """Compile an expression string after checking it uses only arithmetic,
+    comparisons and FUNCTIONS."""
+    try:
+        tree = ast.parse(text, mode="eval")
+    except SyntaxError as e:
+        raise SpecError(f"bad expression {text!r}: {e.msg}") from None
+    for node in ast.walk(tree):
+        if not isinstance(node, EXPRESSION_NODES):
+            raise SpecError(f"bad expression {text!r}: {type(node).__name__} not allowed")
+        if isinstance(node, ast.Call) and (
+                not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS
+                or node.keywords):
+            raise SpecError(f"bad expression {text!r}: only {', '.join(FUNCTIONS)} can be called")
+    return compile(tree, text, "eval")
+
+
+class Context:
+    """Names visible to expressions: FUNCTIONS, the pixel grid and "let" values."""
+
+    def __init__(self, names):
+        self.names = names
+
+    def child(self, **names):
+        return Context({**self.names, **names})
+
+    def value(self, item):
+        """A number, list or compiled expression evaluated in this context."""
+        if isinstance(item, list):
+            return [self.value(v) for v in item]
+        if not isinstance(item, types.CodeType):
+            return item
+        try:
+            return eval(item, {"__builtins__": {}}, self.names)
+        except NameError as e:
+            raise SpecError(f"{item.co_filename!r}: {e}") from None
+
+    def let(self, definitions):
+        context = self
+        for name, expression in definitions.items():
+            context = context.child(**{name: context.value(expression)})
+        return context
+
+
+# Keys of a draw item (and of its shape or paint) whose values are numbers or expressions
+EXPRESSION_KEYS = ("rect", "points", "ellipse", "ring", "where", "limit", "clip", "and")
+SHAPE_EXPRESSION_KEYS = {"taper": ("rows", "cx", "half_width"), "stroke": ("x", "y", "half_width")}
+
+
+def compile_values(value):
+    """Compile the expression strings in a value, a list of values or a list of lists."""
+    if isinstance(value, str):
+        return compile_expression(value)
+    if isinstance(value, list):
+        return [compile_values(v) for v in value]
+    return value
+
+
+def compile_let(definitions):
+    return {name: compile_values(value) for name, value in definitions.items()}
+
+
+def precompile(item):
+    """A copy of a draw item with the strings in its expression keys compiled.
+
+    Colour and layer names stay strings, and keys the renderer does not use,
+    such as a "note", are left alone.
+    """
+    item = dict(item)
+    for key in EXPRESSION_KEYS:
+        if key in item:
+            item[key] = compile_values(item[key])
+    for shape, keys in SHAPE_EXPRESSION_KEYS.items():
+        if isinstance(item.get(shape), dict):
+            item[shape] = {k: compile_values(v) if k in keys else v for k, v in item[shape].items()}
+    if isinstance(item.get("stroke"), dict) and isinstance(item["stroke"].get("over"), dict):
+        item["stroke"]["over"] = compile_let(item["stroke"]["over"])
+    if isinstance(item.get("gradient"), dict) and "t" in item["gradient"]:
+        item["gradient"] = {**item["gradient"], "t": compile_values(item["gradient"]["t"])}
+    if isinstance(item.get("let"), dict):
+        item["let"] = compile_let(item["let"])
+    return item
+
+
+def check_colors(colors, where):
+    for name, color in colors.items():
+        if (not isinstance(color, list) or len(color) != 4
+                or not all(isinstance(c, int) and 0 <= c <= 255 for c in color)):
+            raise SpecError(f"{where}: colour {name!r} must be [r, g, b, a] in 0-255")
+
+
+def shape_mask(canvas, item, context):
+    """Boolean mask of an item's shape (strokes are drawn by draw_stroke)."""
+    (kind,) = [k for k in SHAPES if k in item]
+    arg = item[kind]
+    if kind == "rect":
+        mask = raster.box(canvas, *context.value(arg))
+    elif kind == "points":
+        mask = np.zeros(canvas.shape[:2], dtype=bool)
+        raster.put(mask, context.value(arg), True)
+    elif kind == "ellipse":
+        mask = raster.ellipse(canvas, *context.value(arg), limit=context.value(item.get("limit", 1.0)))
+    elif kind == "ring":
+        cx, cy, rx, ry, rx_in, ry_in = context.value(arg)
+        mask = raster.ring(canvas, cx, cy, (rx, ry), (rx_in, ry_in))
+    elif kind == "taper":
+        y0, y1 = context.value(arg["rows"])
+        half_width = np.broadcast_to(context.value(arg["half_width"]), (canvas.shape[0], 1))
+        mask = raster.taper(canvas, y0, context.value(arg["cx"]), half_width[y0:y1, 0])
+    else:
+        mask = np.broadcast_to(context.value(arg), canvas.shape[:2])
+    if "clip" in item:
+        mask = mask & raster.box(canvas, *context.value(item["clip"]))
+    if "and" in item:
+        mask = mask & context.value(item["and"])
+    return mask
+
+
+def draw_stroke(canvas, item, context, index):
+    arg = item["stroke"]
+    ((name, bounds),) = arg["over"].items()
+    points = context.child(**{name: np.arange(*context.value(bounds))})
+    n = len(points.names[name])
+    xs = np.broadcast_to(points.value(arg["x"]), (n,))
+    ys = np.broadcast_to(points.value(arg["y"]), (n,))
+    raster.stroke(canvas, xs, ys, index, half_width=context.value(arg.get("half_width", 0)))
+
+
+class Sprite:
+    """A spec compiled to one palette-index canvas per layer."""
+
+    def __init__(self, spec, name="sprite"):
+        self.name = name
+        self.width, self.height = spec["size"]
+        self.output = spec.get("output", os.path.join("assets", name + ".png"))
+        self.colors = dict(spec["palette"])
+        self.variants = spec.get("variants", {})
+        check_colors(self.colors, name)
+        for variant, options in self.variants.items():
+            check_colors(options.get("palette", {}), f"{name} variant {variant!r}")
+        if len(self.colors) > 255:
+            raise SpecError(f"{name}: more than 255 palette colours")
+        self.index = {color: i + 1 for i, color in enumerate(self.colors)}  # 0 is transparent
+
+        grid = raster.new(self.width, self.height)
+        y, x = raster.coords(grid)
+        context = Context({**FUNCTIONS, "x": x, "y": y, "width": self.width, "height": self.height})
+        try:
+            context = context.let(compile_let(spec.get("let", {})))
+        except (KeyError, TypeError, ValueError) as e:
+            raise SpecError(f"{name}: let: {e}") from None
+        self.layers = {}
+        for i, layer in enumerate(spec["layers"]):
+            layer_name = layer.get("name", f"layer{i}")
+            canvas = np.zeros((self.height, self.width), dtype=np.uint8)
+            for j, item in enumerate(layer["draw"]):
+                try:
+                    self._draw(canvas, precompile(item), context)
+                except (KeyError, TypeError, ValueError) as e:
+                    raise SpecError(f"{name}: layer {layer_name!r}, item {j}: {e}") from None
+            self.layers[layer_name] = canvas
+
+    def _color(self, name):
+        if name not in self.index:
+            raise SpecError(f"unknown colour {name!r}")
+        return self.index[name]
+
+    def _draw(self, canvas, item, context):
+        shapes = [k for k in SHAPES if k in item]
+        paints = [k for k in PAINTS if k in item]
+        if len(shapes) != 1 or len(paints) != 1:
+            raise SpecError(f"need one shape ({', '.join(SHAPES)}) and one paint "
+                            f"({', '.join(PAINTS)}), got {sorted(item)}")
+        context = context.let(item.get("let", {}))
+        if shapes[0] == "stroke":
+            if paints[0] != "color":
+                raise SpecError("strokes take a plain colour")
+            draw_stroke(canvas, item, context, self._color(item["color"]))
+            return
+        mask = shape_mask(canvas, item, context)
+        if "color" in item:
+            raster.fill(canvas, mask, self._color(item["color"]))
+        elif "texture" in item:
+            texture = item["texture"]
+            raster.texture(canvas, mask, self._color(texture["base"]),
+                           [((a, b, m), self._color(c)) for a, b, m, c in texture["patterns"]])
+        else:
+            gradient = item["gradient"]
+            raster.gradient(canvas, mask, context.value(gradient["t"]), gradient["stops"],
+                            [self._color(c) for c in gradient["colors"]])
+
+    def indices(self, hide=()):
+        """Palette indices of the visible layers composited in order."""
+        unknown = set(hide) - self.layers.keys()
+        if unknown:
+            raise SpecError(f"{self.name}: no layer {', '.join(sorted(unknown))}")
+        out = np.zeros((self.height, self.width), dtype=np.uint8)
+        for name, layer in self.layers.items():
+            if name not in hide:
+                np.copyto(out, layer, where=layer > 0)
+        return out
+
+    def render(self, palette=None, hide=()):
+        """RGBA canvas, with colours in `palette` overriding the spec's."""
+        colors = {**self.colors, **{k: v for k, v in (palette or {}).items() if k in self.colors}}
+        lookup = np.array([TRANSPARENT, *colors.values()], dtype=np.uint8)
+        return lookup[self.indices(hide)]
+
+
+def load_sprite(path):
+    with open(path) as f:
+        spec = json.load(f)
+    return Sprite(spec, os.path.splitext(os.path.basename(path))[0])
+
+
+def variant_path(output, variant):
+    stem, ext = os.path.splitext(output)
+    return f"{stem}_{variant}{ext}"
+
+
+def render_file(path, palette=None, variants=False, output_dir=None):
+    """Compile one spec and save it (and its variants); returns [(path, width, height)]."""
+    sprite = load_sprite(path)
+    if palette:
+        check_colors(palette, "--palette")
+    jobs = [(sprite.output, {})]
+    if variants:
+        jobs += [(options.get("output", variant_path(sprite.output, variant)), options)
+                 for variant, options in sprite.variants.items()]
+    saved = []
+    for output, options in jobs:
+        if output_dir:
+            output = os.path.join(output_dir, os.path.basename(output))
+        colors = {**options.get("palette", {}), **(palette or {})}
+        raster.save(sprite.render(colors, options.get("hide", ())), output)
+        saved.append((output, sprite.width, sprite.height))
+    return saved
+
+
+def render_files(paths, palette=None, variants=False, output_dir=None, jobs=None):
+    """render_file for each spec, in worker processes when there are several."""
+    if len(paths) <= 1 or jobs == 1:
+        return [render_file(path, palette, variants, output_dir) for path in paths]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(jobs) as pool:
+        futures = [pool.submit(render_file, path, palette, variants, output_dir) for path in paths]
+        return [future.result() for future in futures]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render sprites from JSON specs.")
+    parser.add_argument("specs", nargs="*", help=f"spec files (default: {SPRITE_DIR}/*.json)")
+    parser.add_argument("--variants", action="store_true", help="also render each spec's variants")
+    parser.add_argument("--palette", help="JSON file of colour overrides, {name: [r, g, b, a]}")
+    parser.add_argument("-o", "--output-dir", help="write PNGs here instead of their spec paths")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    paths = args.specs or sorted(glob.glob(os.path.join(SPRITE_DIR, "*.json")))
+    palette = None
+    if args.palette:
+        with open(args.palette) as f:
+            palette = json.load(f)
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    began = time.perf_counter()
+    try:
+        results = render_files(paths, palette, args.variants, args.output_dir, args.jobs)
+    except SpecError as e:
+        parser.exit(1, f"error: {e}\n")
+    for saved in results:
+        for output, width, height in saved:
+            print(f"Created {output} ({width}x{height})")
+    print(f"{sum(map(len, results))} sprites in {time.perf_counter() - began:.2f}s")
@@ -0,0 +1,151 @@
+"""Writer for xTile's binary TBIN map format (the format of vanilla .tbin maps).
+
+The game loads TBIN natively, with no XML parsing. Layout (little-endian):
+
+    "tBIN10"
+    string id, string description, properties
+    int32 tilesheet count, tilesheets
+    int32 layer count, layers
+
+A string is an int32 byte length followed by UTF-8. Properties are an int32
+count of (string key, byte type, value) with types 0 bool (byte), 1 int32,
+2 float32 and 3 string. Per-tile tilesheet properties such as Water=T are
+stored as tilesheet properties named "@TileIndex@<index>@<name>".
+
+Layer rows are run-length encoded with single-byte commands: "N" + int32
+skips a run of empty cells, "T" + string switches the current tilesheet
+(kept across rows), and "S" + int32 index + blend byte + properties places
+one static tile. A tilesheet is therefore named once per run of tiles from
+it, not once per tile.
+
+Maps come from the shared tmx.TileMap model, so the TBIN uses the same
+tilesheet names and GID numbering as the TMX.
+"""
+import struct
+
+import numpy as np
+
+from tmx import stream_layers
+
+MAGIC = b"tBIN10"
+TILE_SIZE = 16
+
+_STATIC_TILE = np.dtype([("command", "S1"), ("index", "<i4"), ("blend", "u1"), ("properties", "<i4")])
+
+
+def pack_string(text):
+    data = text.encode("utf-8")
+    return struct.pack("<i", len(data)) + data
+
+
+def pack_properties(properties=None):
+    """Encode a {name: value} dict; bools, ints, floats and strings are supported."""
+    properties = properties or {}
+    parts = [struct.pack("<i", len(properties))]
+    for name, value in properties.items():
+        parts.append(pack_string(name))
+        if isinstance(value, bool):
+            parts.append(struct.pack("<bB", 0, value))
+        elif isinstance(value, int):
+            parts.append(struct.pack("<bi", 1, value))
+        elif isinstance(value, float):
+            parts.append(struct.pack("<bf", 2, value))
+        elif isinstance(value, str):
+            parts.append(struct.pack("<b", 3) + pack_string(value))
+        else:
+            raise TypeError(f"unsupported TBIN property type for {name!r}: {type(value).__name__}")
+    return b"".join(parts)
+
+
+def pack_size(width, height):
+    return struct.pack("<ii", width, height)
+
+
+def pack_tilesheet(tileset):
+    properties = {}
+    for index, props in sorted(tileset.tile_properties.items()):
+        for name, value in props.items():
+            properties[f"@TileIndex@{index}@{name}"] = value
+    return b"".join((
+        pack_string(tileset.name),
+        pack_string(""),
+        pack_string(tileset.image),
+        pack_size(tileset.columns, tileset.rows),
+        pack_size(TILE_SIZE, TILE_SIZE),
+        pack_size(0, 0),  # margin
+        pack_size(0, 0),  # spacing
+        pack_properties(properties),
+    ))
+
+
+def pack_layer_header(name, width, height):
+    return b"".join((
+        pack_string(name),
+        b"\x01",  # visible
+        pack_string(""),
+        pack_size(width, height),
+        pack_size(TILE_SIZE, TILE_SIZE),
+        pack_properties(),
+    ))
+
+
+class LayerEncoder:
+    """Run-length encodes a layer's rows, in as many chunks of rows as needed."""
+
+    def __init__(self, tilesets):
+        self.tilesets = tilesets
+        self.ids = [pack_string(tileset.name) for tileset in tilesets]
+        self.firstgids = tilesets.firstgids
+        self._current = None
+
+    def feed(self, rows):
+        """Encoded bytes for the next rows of the layer."""
+        rows = np.asarray(rows, dtype=np.int64).reshape(-1, np.shape(rows)[-1])
+        sheets = self.tilesets.index(rows)
+        return b"".join(self._row(row, sheet) for row, sheet in zip(rows, sheets))
+
+    def _row(self, row, sheet):
+        bounds = np.flatnonzero(np.diff(sheet)) + 1
+        starts = [0, *bounds.tolist()]
+        ends = [*bounds.tolist(), len(row)]
+        parts = []
+        for start, end in zip(starts, ends):
+            k = int(sheet[start])
+            if k < 0:
+                parts.append(b"N" + struct.pack("<i", end - start))
+                continue
+            if k != self._current:
+                parts.append(b"T" + self.ids[k])
+                self._current = k
+            tiles = np.zeros(end - start, dtype=_STATIC_TILE)
+            tiles["command"] = b"S"
+            tiles["index"] = row[start:end] - self.firstgids[k]
+            parts.append(tiles.tobytes())
+        return b"".join(parts)
+
+    def finish(self):
+        return b""
+
+
+def pack_map_header(map_id, tilesets, layer_count, properties=None):
+    """Everything before the first layer; the layers follow in order."""
+    return b"".join((
+        MAGIC,
+        pack_string(map_id),
+        pack_string(""),
+        pack_properties(properties),
+        struct.pack("<i", len(tilesets)),
+        *(pack_tilesheet(tileset) for tileset in tilesets),
+        struct.pack("<i", layer_count),
+    ))
+
+
+def write_tbin(f, tile_map, bands=None):
+    """Write a TileMap as TBIN to an open binary file (bands as for tmx.write_tmx)."""
+    names = tile_map.layer_names
+    f.write(pack_map_header(tile_map.name, tile_map.tilesets, len(names)))
+    layers = None if bands is not None else [tile_map.layer(name) for name in names]
+    encoders = [LayerEncoder(tile_map.tilesets) for _ in names]
+    stream_layers(f, layers, bands,
+                  lambda i: pack_layer_header(names[i], tile_map.width, tile_map.height),
+                  encoders, lambda i: b"", binary=True)
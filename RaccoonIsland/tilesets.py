@@ -0,0 +1,149 @@
+"""Tileset registry: firstgid allocation and GID decoding for the map generators.
+
+Tilesets take their grid from the tilesheet image itself when it is
+available (the width and height are read from the PNG header, no decoding),
+so a map can no longer disagree with the sheet it points at. Registering
+them in map order allocates firstgids back to back, and any GID, or a whole
+array of them, resolves to (tileset, local id, row, col) by bisecting the
+sorted firstgids.
+
+    TILESETS = TilesetRegistry()
+    BEACH = TILESETS.add(Tileset.from_image("z_beach", "Maps/spring_beach.png"))
+    BEACH.gid(3, 6)             # GID of row 3, col 6
+    TILESETS.resolve(gid)       # (BEACH, 57, 3, 6)
+"""
+import bisect
+import os
+import struct
+
+import numpy as np
+
+TILE_SIZE = 16
+# Extracted vanilla tilesheets, named like their Maps/ content paths
+GAME_SHEETS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           os.pardir, "extracted_assets")
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def png_size(path):
+    """(width, height) of a PNG, read from its IHDR chunk."""
+    with open(path, "rb") as f:
+        header = f.read(24)
+    if header[:8] != _PNG_SIGNATURE or header[12:16] != b"IHDR":
+        raise ValueError(f"{path} is not a PNG")
+    return struct.unpack(">II", header[16:24])
+
+
+class Tileset:
+    """A tilesheet image cut into 16x16 tiles."""
+
+    def __init__(self, name, image, columns, rows, tile_properties=None):
+        self.name = name
+        self.image = image
+        self.columns = columns
+        self.rows = rows
+        self.tile_properties = tile_properties or {}  # {tile index: {name: value}}
+        self.firstgid = None  # set when added to a registry
+
+    @classmethod
+    def from_image(cls, name, image, size=None, path=None, tile_properties=None):
+        """A tileset sized from its image.
+
+        The PNG is looked for at `path`, or among the extracted game sheets
+        by file name. `size` (width, height in pixels) is used for sheets
+        that are not on disk, such as ones the mod generates.
+        """
+        if path is None:
+            filename = os.path.basename(image)
+            path = os.path.join(GAME_SHEETS, filename if filename.endswith(".png")
+                                else filename + ".png")
+        if os.path.exists(path):
+            size = png_size(path)
+        elif size is None:
+            raise FileNotFoundError(f"no image for tileset {name!r} at {path} and no size given")
+        width, height = size
+        return cls(name, image, width // TILE_SIZE, height // TILE_SIZE, tile_properties)
+
+    @property
+    def tilecount(self):
+        return self.columns * self.rows
+
+    def gid(self, row, col=None):
+        """GID of tile (row, col), or of tile index `row` when col is omitted."""
+        index = row if col is None else row * self.columns + col
+        return self.firstgid + index
+
+    def __repr__(self):
+        return f"Tileset({self.name!r}, firstgid={self.firstgid}, {self.columns}x{self.rows})"
+
+
+class TilesetRegistry:
+    """Tilesets in GID order, with bisect lookup from GID back to tile."""
+
+    def __init__(self, tilesets=()):
+        self._tilesets = []
+        self._firstgids = []
+        for tileset in tilesets:
+            self.add(tileset)
+
+    def add(self, tileset, firstgid=None):
+        """Append a tileset, by default right after the last one; returns it."""
+        if firstgid is None:
+            last = self._tilesets[-1] if self._tilesets else None
+            firstgid = last.firstgid + last.tilecount if last else 1
+        elif self._tilesets and firstgid < self._firstgids[-1] + self._tilesets[-1].tilecount:
+            raise ValueError(f"firstgid {firstgid} of {tileset.name!r} overlaps "
+                             f"{self._tilesets[-1].name!r}")
+        tileset.firstgid = firstgid
+        self._tilesets.append(tileset)
+        self._firstgids.append(firstgid)
+        return tileset
+
+    def __iter__(self):
+        return iter(self._tilesets)
+
+    def __len__(self):
+        return len(self._tilesets)
+
+    def __getitem__(self, name):
+        for tileset in self._tilesets:
+            if tileset.name == name:
+                return tileset
+        raise KeyError(name)
+
+    @property
+    def firstgids(self):
+        return np.array(self._firstgids, dtype=np.int64)
+
+    def resolve(self, gid):
+        """(tileset, local id, row, col) of a GID; raises KeyError for 0 or unknown GIDs."""
+        i = bisect.bisect_right(self._firstgids, gid) - 1
+        if gid <= 0 or i < 0:
+            raise KeyError(gid)
+        tileset = self._tilesets[i]
+        local = gid - tileset.firstgid
+        if local >= tileset.tilecount:
+            raise KeyError(gid)
+        row, col = divmod(local, tileset.columns)
+        return tileset, local, row, col
+
+    def index(self, gids):
+        """Tileset position of every GID in an array, -1 for empty or unknown cells."""
+        gids = np.asarray(gids, dtype=np.int64)
+        index = np.searchsorted(self.firstgids, gids, side="right") - 1
+        counts = np.array([t.tilecount for t in self._tilesets] + [0], dtype=np.int64)
+        local = gids - self.firstgids[np.maximum(index, 0)]
+        index[(gids <= 0) | (index < 0) | (local >= counts[index])] = -1
+        return index
+
+    def resolve_array(self, gids):
+        """Vectorized resolve: (tileset index, local id, row, col) arrays, -1 where empty."""
+        gids = np.asarray(gids, dtype=np.int64)
+        index = self.index(gids)
+        valid = index >= 0
+        firstgids = np.append(self.firstgids, 0)
+        columns = np.array([t.columns for t in self._tilesets] + [1], dtype=np.int64)
+        local = np.where(valid, gids - firstgids[index], -1)
+        row, col = np.divmod(local, columns[index])
+        return index, local, np.where(valid, row, -1), np.where(valid, col, -1)
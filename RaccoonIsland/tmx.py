@@ -0,0 +1,358 @@
+"""Shared map model and TMX writer for the map generators.
+
+A TileMap holds a tileset registry (see tilesets.py) and its layers as
+NumPy uint32 GID grids. One serializer writes every map, either from the
+whole layers or from an iterator of row bands for maps too large to hold
+at once.
+
+Layers can be written as Tiled's plain CSV or as base64 of the packed
+little-endian uint32 GIDs, optionally compressed with zlib, gzip or zstd
+(zstd needs the `zstandard` package). Both go through NumPy, never through
+per-cell string formatting.
+"""
+import base64
+import io
+import shutil
+import tempfile
+import zlib
+
+import numpy as np
+
+from tilesets import TILE_SIZE, TilesetRegistry
+
+ENCODINGS = ("csv", "base64")
+COMPRESSIONS = ("zlib", "gzip", "zstd")
+LAYER_NAMES = ("Back", "Buildings", "Front")
+
+
+class TileMap:
+    """An orthogonal 16x16 map: tilesets plus named uint32 GID layers."""
+
+    def __init__(self, name, width, height, tilesets=None, layer_names=LAYER_NAMES):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.layer_names = tuple(layer_names)
+        self.tilesets = tilesets if tilesets is not None else TilesetRegistry()
+        self.layers = {}
+
+    def add_tileset(self, tileset, firstgid=None):
+        """Add a tileset after the existing ones and return it with its firstgid set."""
+        return self.tilesets.add(tileset, firstgid)
+
+    def layer(self, name):
+        """The (height, width) GID grid of a layer, created empty on first use."""
+        if name not in self.layers:
+            self.layers[name] = np.zeros((self.height, self.width), dtype=np.uint32)
+        return self.layers[name]
+
+    def set_layer(self, name, grid):
+        """Replace a layer with a grid given as rows of ints or an array."""
+        grid = np.asarray(grid, dtype=np.uint32)
+        if grid.shape != (self.height, self.width):
+            raise ValueError(f"layer {name!r} is {grid.shape[1]}x{grid.shape[0]}, "
+                             f"map is {self.width}x{self.height}")
+        self.layers[name] = grid
+
+    def write(self, f, encoding="csv", compression=None, bands=None):
+        """Write the map as TMX to an open text file (see write_tmx)."""
+        write_tmx(f, self, encoding, compression, bands)
+
+    def tostring(self, encoding="csv", compression=None):
+        buf = io.StringIO()
+        self.write(buf, encoding, compression)
+        return buf.getvalue()
+
+
+def pack_gids(layer):
+    """Little-endian uint32 bytes of a NumPy layer (or block of its rows)."""
+    return layer.astype("<u4", copy=False).tobytes()
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError("zstd compression needs the 'zstandard' package") from None
+    return zstandard
+
+
+def rows_to_csv(rows):
+    """CSV text for a block of layer rows, formatted without per-cell str() calls.
+
+    Every distinct GID is formatted once as a "gid," token; the block is then
+    gathered byte by byte from those tokens, with a newline after each row.
+    """
+    rows = np.asarray(rows)
+    values, inverse = np.unique(rows, return_inverse=True)
+    tokens = [f"{v},".encode() for v in values.tolist()] + [b"\n"]
+    lengths = np.array([len(t) for t in tokens])
+    chars = np.zeros((len(tokens), lengths.max()), dtype=np.uint8)
+    for i, token in enumerate(tokens):
+        chars[i, :len(token)] = np.frombuffer(token, dtype=np.uint8)
+
+    cells = np.empty((rows.shape[0], rows.shape[1] + 1), dtype=np.intp)
+    cells[:, :-1] = inverse.reshape(rows.shape)
+    cells[:, -1] = len(tokens) - 1  # row terminator
+    cells = cells.ravel()
+    cell_lengths = lengths[cells]
+    starts = np.repeat(np.cumsum(cell_lengths) - cell_lengths, cell_lengths)
+    offsets = np.arange(len(starts)) - starts
+    return chars[np.repeat(cells, cell_lengths), offsets].tobytes().decode("ascii")
+
+
+class CsvEncoder:
+    """Incremental CSV for layer data written in chunks of rows.
+
+    Tiled omits the comma after the final cell, so the ",\\n" ending each
+    chunk is held back until the next chunk shows it was not the last.
+    """
+
+    def __init__(self):
+        self._started = False
+
+    def feed(self, rows):
+        text = rows_to_csv(rows)
+        if not text:
+            return ""
+        text = (",\n" if self._started else "") + text[:-2]
+        self._started = True
+        return text
+
+    def finish(self):
+        return ""
+
+
+class LayerEncoder:
+    """Incremental base64(+compression) encoder for layer data written in chunks."""
+
+    def __init__(self, compression=None):
+        if compression == "zlib":
+            self._compressor = zlib.compressobj(9)
+        elif compression == "gzip":
+            self._compressor = zlib.compressobj(9, wbits=16 + zlib.MAX_WBITS)
+        elif compression == "zstd":
+            self._compressor = _zstd().ZstdCompressor(level=19).compressobj()
+        elif compression is None:
+            self._compressor = None
+        else:
+            raise ValueError(f"unknown compression: {compression}")
+        self._pending = b""
+
+    def _encode(self, data, final=False):
+        data = self._pending + data
+        cut = len(data) if final else len(data) - len(data) % 3
+        self._pending = data[cut:]
+        return base64.b64encode(data[:cut]).decode("ascii")
+
+    def feed(self, layer):
+        """Encode another chunk of rows; returns the base64 text available so far."""
+        data = pack_gids(layer)
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        return self._encode(data)
+
+    def finish(self):
+        tail = self._compressor.flush() if self._compressor is not None else b""
+        return self._encode(tail, final=True)
+
+
+def layer_encoder(encoding="csv", compression=None):
+    if encoding == "csv":
+        return CsvEncoder()
+    return LayerEncoder(compression)
+
+
+def data_open(encoding="csv", compression=None):
+    """Opening <data> tag (with its trailing newline) for a layer."""
+    if encoding == "csv":
+        return '  <data encoding="csv">\n'
+    if compression:
+        return f'  <data encoding="base64" compression="{compression}">\n   '
+    return '  <data encoding="base64">\n   '
+
+
+def data_close(encoding="csv"):
+    """Closing </data> tag, matching the layout data_open() started."""
+    return "\n</data>" if encoding == "csv" else "\n  </data>"
+
+
+def stream_layers(f, layers, bands, start, encoders, end, binary=False):
+    """Write each layer as start(i), its encoded rows, encoders[i].finish(), end(i).
+
+    Without `bands` the layers are encoded whole. With an iterator of row
+    bands (one block of rows per layer), each band is consumed once: the
+    first layer goes straight to `f` and the rest are spooled to temporary
+    files, so only a band of every layer is ever in memory.
+    """
+    count = len(encoders)
+    if bands is None:
+        for i in range(count):
+            f.write(start(i) + encoders[i].feed(layers[i]) + encoders[i].finish() + end(i))
+        return
+
+    spools = [tempfile.TemporaryFile("w+b" if binary else "w+") for _ in range(count - 1)]
+    try:
+        f.write(start(0))
+        for band in bands:
+            f.write(encoders[0].feed(band[0]))
+            for spool, encoder, rows in zip(spools, encoders[1:], band[1:]):
+                spool.write(encoder.feed(rows))
+        f.write(encoders[0].finish() + end(0))
+        for i, spool in enumerate(spools, 1):
+            f.write(start(i))
+            spool.seek(0)
+            shutil.copyfileobj(spool, f, 1 << 20)
+            f.write(encoders[i].finish() + end(i))
+    finally:
+        for spool in spools:
+            spool.close()
+
+
+def tileset_xml(tileset):
+    tiles = "".join(
+        f'  <tile id="{index}">\n'
+        f'   <properties>\n'
+        + "".join(f'    <property name="{name}" value="{value}"/>\n'
+                  for name, value in props.items())
+        + f'   </properties>\n'
+        f'  </tile>\n'
+        for index, props in sorted(tileset.tile_properties.items())
+    )
+    return (f' <tileset firstgid="{tileset.firstgid}" name="{tileset.name}" '
+            f'tilewidth="{TILE_SIZE}" tileheight="{TILE_SIZE}" '
+            f'tilecount="{tileset.tilecount}" columns="{tileset.columns}">\n'
+            f'  <image source="{tileset.image}" width="{tileset.columns * TILE_SIZE}" '
+            f'height="{tileset.rows * TILE_SIZE}"/>\n'
+            f'{tiles} </tileset>\n')
+
+
+def map_header(tile_map):
+    """Everything before the first layer: the <map> tag and the tilesets."""
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<map version="1.10" tiledversion="1.11.0" orientation="orthogonal" '
+            f'renderorder="right-down" width="{tile_map.width}" height="{tile_map.height}" '
+            f'tilewidth="{TILE_SIZE}" tileheight="{TILE_SIZE}" infinite="0" '
+            f'nextlayerid="{len(tile_map.layer_names) + 1}" nextobjectid="1">\n'
+            + "".join(tileset_xml(tileset) for tileset in tile_map.tilesets))
+
+
+def layer_start(tile_map, i, encoding="csv", compression=None):
+    return (f' <layer id="{i + 1}" name="{tile_map.layer_names[i]}" '
+            f'width="{tile_map.width}" height="{tile_map.height}">\n'
+            + data_open(encoding, compression))
+
+
+def layer_end(encoding="csv"):
+    return data_close(encoding) + "\n </layer>\n"
+
+
+def write_tmx(f, tile_map, encoding="csv", compression=None, bands=None):
+    """Write a TileMap as TMX to an open text file.
+
+    `bands`, if given, iterates over blocks of rows for every layer in
+    layer_names order, replacing the map's in-memory layers.
+    """
+    names = tile_map.layer_names
+    f.write(map_header(tile_map))
+    layers = None if bands is not None else [tile_map.layer(name) for name in names]
+    encoders = [layer_encoder(encoding, compression) for _ in names]
+    stream_layers(f, layers, bands,
+                  lambda i: layer_start(tile_map, i, encoding, compression),
+                  encoders, lambda i: layer_end(encoding))
+    f.write("</map>\n")
+
+
+class MapTemplate:
+    """A base TileMap serialized once, instanced as variants with sparse patches.
+
+    A patch is {layer name: {(x, y): gid}}. The header and every unpatched
+    layer are formatted once; a CSV layer keeps its rows as text so a
+    variant only reformats the rows it touches (base64 layers re-encode
+    the patched layer). Variants with equal patches share one cached
+    result, so many identical interiors cost about as much as one.
+    """
+
+    def __init__(self, tile_map, encoding="csv", compression=None):
+        self.tile_map = tile_map
+        self.encoding = encoding
+        self.compression = compression
+        self._header = map_header(tile_map)
+        self._rows = {}    # layer name -> CSV text of each row
+        self._blocks = {}  # layer name -> unpatched <layer> element
+        self._cache = {}   # patch key -> TMX text
+
+    @staticmethod
+    def key(patch=None):
+        """A hashable key that is equal for patches that set the same cells."""
+        return tuple(sorted((name, y, x, int(gid))
+                            for name, cells in (patch or {}).items()
+                            for (x, y), gid in cells.items()))
+
+    def instance(self, patch=None, name=None):
+        """A new TileMap: the base with `patch` applied (for other writers, e.g. TBIN)."""
+        base = self.tile_map
+        tile_map = TileMap(name or base.name, base.width, base.height, base.tilesets, base.layer_names)
+        for name in base.layer_names:
+            tile_map.set_layer(name, base.layer(name).copy())
+        for name, cells in (patch or {}).items():
+            grid = tile_map.layer(name)
+            for (x, y), gid in cells.items():
+                grid[y, x] = gid
+        return tile_map
+
+    def _layer_text(self, name, cells):
+        grid = self.tile_map.layer(name)
+        if self.encoding != "csv":
+            if cells:
+                grid = grid.copy()
+                for (x, y), gid in cells.items():
+                    grid[y, x] = gid
+            encoder = layer_encoder(self.encoding, self.compression)
+            return encoder.feed(grid) + encoder.finish()
+        if name not in self._rows:
+            self._rows[name] = rows_to_csv(grid).splitlines(keepends=True)
+        rows = self._rows[name]
+        if cells:
+            rows = list(rows)
+            for y in {y for _, y in cells}:
+                row = grid[y].copy()
+                for (x, cell_y), gid in cells.items():
+                    if cell_y == y:
+                        row[x] = gid
+                rows[y] = rows_to_csv(row[None])
+        return "".join(rows)[:-2]
+
+    def _layer(self, i, cells):
+        name = self.tile_map.layer_names[i]
+        if not cells and name in self._blocks:
+            return self._blocks[name]
+        block = (layer_start(self.tile_map, i, self.encoding, self.compression)
+                 + self._layer_text(name, cells) + layer_end(self.encoding))
+        if not cells:
+            self._blocks[name] = block
+        return block
+
+    def render(self, patch=None):
+        """The TMX text of the base with `patch` applied."""
+        key = self.key(patch)
+        if key not in self._cache:
+            patch = patch or {}
+            self._cache[key] = (self._header
+                                + "".join(self._layer(i, patch.get(name))
+                                          for i, name in enumerate(self.tile_map.layer_names))
+                                + "</map>\n")
+        return self._cache[key]
+
+
+def add_encoding_args(parser):
+    """Add --encoding/--compression options to a generator's argument parser."""
+    parser.add_argument("--encoding", choices=ENCODINGS, default="csv",
+                        help="layer data encoding (default: csv)")
+    parser.add_argument("--compression", choices=COMPRESSIONS,
+                        help="compress base64 layer data")
+
+
+def check_encoding_args(parser, args):
+    if args.compression and args.encoding != "base64":
+        parser.error("--compression needs --encoding base64")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Compare TMX maps layer by layer, cell by cell.
+
+Both maps are loaded with tmx_reader and every layer is compared as a
+whole array. Cells are compared by tile (tileset name and local tile id)
+rather than raw GID, so renumbered firstgids are not reported as changes;
+--raw compares GIDs as stored. Exits 1 when anything differs, like diff.
+
+Usage:
+    python tmx_diff.py old.tmx new.tmx [--heatmap changes.png]
+    python tmx_diff.py old_assets/ assets/ [--heatmap heatmaps/]
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from tmx_reader import read_tmx
+
+HEATMAP_SCALE = 4  # pixels per tile
+# Heatmap colour per layer; any further layers show as white
+LAYER_COLORS = {"Back": (255, 64, 64), "Buildings": (64, 255, 64), "Front": (64, 128, 255)}
+
+
+def tile_keys(tile_map, grid, names):
+    """Map GIDs to keys that are equal exactly when two cells show the same tile.
+
+    `names` gives each tileset name a fixed block of keys, shared by both
+    maps being compared; empty or unknown cells are -1.
+    """
+    index, local, _, _ = tile_map.tilesets.resolve_array(grid)
+    bases = np.array([names[tileset.name] for tileset in tile_map.tilesets] + [0], dtype=np.int64)
+    return np.where(index >= 0, bases[index] + local, -1)
+
+
+def diff_maps(a, b, raw=False):
+    """Per-layer differences between two TileMaps.
+
+    Returns (notes, changes): notes are header-level differences as text,
+    changes maps each layer name present in both maps to a boolean
+    (height, width) array of changed cells over the overlapping area.
+    """
+    notes = []
+    if (a.width, a.height) != (b.width, b.height):
+        notes.append(f"size {a.width}x{a.height} -> {b.width}x{b.height}")
+    sets_a = {t.name: (t.firstgid, t.columns, t.rows, t.image) for t in a.tilesets}
+    sets_b = {t.name: (t.firstgid, t.columns, t.rows, t.image) for t in b.tilesets}
+    for name in sets_a.keys() | sets_b.keys():
+        if sets_a.get(name) != sets_b.get(name):
+            notes.append(f"tileset {name!r}: {sets_a.get(name)} -> {sets_b.get(name)}")
+    for name in a.layer_names:
+        if name not in b.layer_names:
+            notes.append(f"layer {name!r} removed")
+    for name in b.layer_names:
+        if name not in a.layer_names:
+            notes.append(f"layer {name!r} added")
+
+    # One key block per tileset name, big enough for that tileset in either map
+    names, base = {}, 0
+    for tileset in list(a.tilesets) + list(b.tilesets):
+        if tileset.name not in names:
+            names[tileset.name] = base
+            sizes = [t.tilecount for t in list(a.tilesets) + list(b.tilesets) if t.name == tileset.name]
+            base += max(sizes)
+
+    height, width = min(a.height, b.height), min(a.width, b.width)
+    changes = {}
+    for name in a.layer_names:
+        if name not in b.layer_names:
+            continue
+        grid_a = a.layers[name][:height, :width]
+        grid_b = b.layers[name][:height, :width]
+        if raw:
+            changes[name] = grid_a != grid_b
+        else:
+            changes[name] = tile_keys(a, grid_a, names) != tile_keys(b, grid_b, names)
+    return notes, changes
+
+
+def summarize(a, b, changes, top=5):
+    """Text lines describing each changed layer."""
+    lines = []
+    for name, changed in changes.items():
+        count = int(np.count_nonzero(changed))
+        if not count:
+            continue
+        ys, xs = np.nonzero(changed)
+        lines.append(f"layer {name!r}: {count} cells changed "
+                     f"({100 * count / changed.size:.1f}%) in x {xs.min()}-{xs.max()}, "
+                     f"y {ys.min()}-{ys.max()}")
+        height, width = changed.shape
+        pairs = np.stack([a.layers[name][:height, :width][changed],
+                          b.layers[name][:height, :width][changed]], axis=1)
+        values, counts = np.unique(pairs, axis=0, return_counts=True)
+        for i in np.argsort(-counts, kind="stable")[:top]:
+            old, new = values[i]
+            lines.append(f"    {counts[i]:6d} x  GID {old} -> {new}")
+    return lines
+
+
+def write_heatmap(changes, path, scale=HEATMAP_SCALE):
+    """PNG of changed cells, coloured by layer, `scale` pixels per tile."""
+    from PIL import Image
+
+    height, width = next(iter(changes.values())).shape
+    image = np.zeros((height, width, 3), dtype=np.uint16)
+    for name, changed in changes.items():
+        image[changed] += np.array(LAYER_COLORS.get(name, (255, 255, 255)), dtype=np.uint16)
+    image = np.minimum(image, 255).astype(np.uint8)
+    image = image.repeat(scale, axis=0).repeat(scale, axis=1)
+    Image.fromarray(image, "RGB").save(path)
+
+
+def diff_files(path_a, path_b, raw=False, heatmap=None):
+    """Print the differences between two map files; returns True if they differ."""
+    a, b = read_tmx(path_a), read_tmx(path_b)
+    notes, changes = diff_maps(a, b, raw)
+    lines = notes + summarize(a, b, changes)
+    if lines:
+        print(f"--- {path_a}\n+++ {path_b}")
+        for line in lines:
+            print(f"  {line}")
+    if heatmap and changes and any(c.any() for c in changes.values()):
+        write_heatmap(changes, heatmap)
+        print(f"  heatmap: {heatmap}")
+    return bool(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare TMX maps layer by layer.")
+    parser.add_argument("old", help="a .tmx file or a directory of them")
+    parser.add_argument("new")
+    parser.add_argument("--raw", action="store_true", help="compare raw GIDs, not tiles")
+    parser.add_argument("--heatmap", help="write a PNG of changed cells "
+                        "(a directory when comparing directories)")
+    args = parser.parse_args()
+
+    if os.path.isdir(args.old) and os.path.isdir(args.new):
+        old_maps = {f for f in os.listdir(args.old) if f.endswith(".tmx")}
+        new_maps = {f for f in os.listdir(args.new) if f.endswith(".tmx")}
+        if args.heatmap:
+            os.makedirs(args.heatmap, exist_ok=True)
+        differ = False
+        for name in sorted(old_maps - new_maps):
+            print(f"only in {args.old}: {name}")
+        for name in sorted(new_maps - old_maps):
+            print(f"only in {args.new}: {name}")
+        for name in sorted(old_maps & new_maps):
+            heatmap = (os.path.join(args.heatmap, os.path.splitext(name)[0] + ".png")
+                       if args.heatmap else None)
+            differ |= diff_files(os.path.join(args.old, name), os.path.join(args.new, name),
+                                 args.raw, heatmap)
+        differ |= old_maps != new_maps
+    elif os.path.isdir(args.old) or os.path.isdir(args.new):
+        parser.error("compare two files or two directories")
+    else:
+        differ = diff_files(args.old, args.new, args.raw, args.heatmap)
+    sys.exit(1 if differ else 0)
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Check that every warp, tent and exit on a map can be walked to.
+
+A cell is walkable when it has a Back tile, no Buildings tile, and its
+Back tile has no Water property. On the island, water is passable too:
+ModEntry switches the player to swimming past SwimStart, and
+generate_map.py blocks the deep water and the dock edges with Buildings
+tiles, so any water cell without one can be swum.
+
+Walkable cells are labelled into 4-connected components in one vectorized
+pass: each row's walkable cells are split into horizontal runs, runs that
+touch a run in the next row are joined, and the joins are resolved with
+array union-find (hook the larger root onto the smaller, then
+pointer-jump), so the work grows with the number of runs rather than the
+number of cells.
+
+Each map's required points must lie in the component of its arrival
+tile. Positions come from ModEntry.cs:
+
+  RaccoonIsland*  arrival (40,66) from the Farm; the tent pads, the mine
+                  entrance (40,40) and the statue (40,72) past the end of
+                  the dock (reached by swimming) must be reachable, and
+                  every dock tile walkable (scaled with the island size)
+  RaccoonMine     arrival (8,2); the exit tiles (7,11) and (8,11)
+  TentInteriorNN  arrival (3,8); the door tile (3,11)
+
+The check is chosen from the map name, or with --kind (island, mine,
+tent or border). Any other map is checked from its largest component to
+the walkable cells on its border, with a warning. Tents and statues are
+used from a neighbouring tile, so for those the point or one of its
+neighbours must be reached. Exits with status 1 when anything is
+unreachable.
+
+Usage:
+    python validate_map.py                     check every map in assets/
+    python validate_map.py assets/RaccoonIslandXL.tmx
+    python validate_map.py --kind island /tmp/island_test.tmx
+"""
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from generate_map import IslandLayout
+from tmx_reader import read_tmx
+
+ISLAND_ARRIVAL = (40, 66)   # Farm warp lands here
+ISLAND_STATUE = (40, 72)    # RaccoonStatue and its warp back to the Farm
+MINE_ENTRANCE = (40, 40)
+MINE_ARRIVAL = (8, 2)
+MINE_EXITS = [(7, 11), (8, 11)]
+TENT_ARRIVAL = (3, 8)       # PermanentTent entry point
+TENT_EXITS = [(3, 11)]
+KINDS = ("island", "mine", "tent", "border")
+
+
+class Target:
+    """Cells that must be reachable.
+
+    With `use`, reaching any of the cells or a tile next to one is enough
+    (the player interacts from beside it); otherwise every cell must be
+    walkable and connected.
+    """
+
+    def __init__(self, name, cells, use=False):
+        self.name = name
+        self.cells = list(cells)
+        self.use = use
+
+
+def tile_property_mask(tile_map, grid, name):
+    """Boolean array: which cells of `grid` show a tile that has property `name`."""
+    gids = [tileset.firstgid + index for tileset in tile_map.tilesets
+            for index, props in tileset.tile_properties.items() if name in props]
+    lut = np.zeros(max(gids, default=0) + 2, dtype=bool)  # last entry: any higher GID
+    lut[gids] = True
+    return lut[np.minimum(grid, len(lut) - 1)]
+
+
+def walkable(tile_map, swim=False):
+    """Boolean (height, width) mask of cells a player can stand on, or swim
+    through if `swim` is set (water is then blocked only by Buildings tiles)."""
+    back = tile_map.layers["Back"]
+    mask = back != 0
+    if "Buildings" in tile_map.layers:
+        mask &= tile_map.layers["Buildings"] == 0
+    if swim:
+        return mask
+    return mask & ~tile_property_mask(tile_map, back, "Water")
+
+
+def label_components(mask):
+    """4-connected components of a boolean mask.
+
+    Returns (labels, count): labels is an int32 array with 0 for blocked
+    cells and 1..count for the components.
+    """
+    height, width = mask.shape
+    padded = np.zeros((height, width + 1), dtype=bool)  # a blocked cell ends every row
+    padded[:, :width] = mask
+    flat = padded.ravel()
+    starts = flat & ~np.concatenate(([False], flat[:-1]))
+    runs = np.cumsum(starts, dtype=np.int64) - 1
+    run_of = np.where(flat, runs, -1).reshape(height, width + 1)[:, :width]
+    count = int(runs[-1]) + 1 if len(runs) else 0
+    if count == 0:
+        return np.zeros(mask.shape, dtype=np.int32), 0
+
+    # Runs that share a column in adjacent rows are joined, once per pair
+    touching = mask[:-1] & mask[1:]
+    upper, lower = run_of[:-1][touching], run_of[1:][touching]
+    pairs = upper * count + lower
+    first = np.ones(len(pairs), dtype=bool)
+    first[1:] = pairs[1:] != pairs[:-1]
+    upper, lower = upper[first], lower[first]
+
+    parent = np.arange(count)
+    while True:
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+        root_upper, root_lower = parent[upper], parent[lower]
+        apart = root_upper != root_lower
+        if not apart.any():
+            break
+        upper, lower = upper[apart], lower[apart]
+        root_upper, root_lower = root_upper[apart], root_lower[apart]
+        np.minimum.at(parent, np.maximum(root_upper, root_lower),
+                      np.minimum(root_upper, root_lower))
+
+    roots, component = np.unique(parent, return_inverse=True)
+    labels = np.zeros(mask.shape, dtype=np.int32)
+    labels[mask] = component[run_of[mask]] + 1
+    return labels, len(roots)
+
+
+def island_targets(tile_map):
+    layout = IslandLayout(tile_map.width, tile_map.height)
+    targets = [
+        Target(f"tent pad {i:02d} ({pad['x']},{pad['y']})",
+               [(pad["x"] + dx, pad["y"] + dy) for dy in range(pad["h"]) for dx in range(pad["w"])],
+               use=True)
+        for i, pad in enumerate(layout.tent_pads, 1)
+    ]
+    targets.append(Target("mine entrance", [layout.point(*MINE_ENTRANCE)], use=True))
+    targets.append(Target("statue", [layout.point(*ISLAND_STATUE)], use=True))
+    targets.append(Target("dock", [(x, y) for y in range(layout.dock_y[0], layout.dock_y[1] + 1)
+                                   for x in layout.path]))
+    return layout.point(*ISLAND_ARRIVAL), targets
+
+
+def border_targets(tile_map, labels):
+    """Fallback for other maps: the largest component must reach the border openings."""
+    sizes = np.bincount(labels.ravel())
+    sizes[0] = 0
+    ys, xs = np.nonzero(labels == sizes.argmax())
+    start = (int(xs[0]), int(ys[0])) if len(xs) else (0, 0)
+    edge = np.zeros(labels.shape, dtype=bool)
+    edge[[0, -1], :] = edge[:, [0, -1]] = True
+    ys, xs = np.nonzero(edge & (labels > 0))
+    return start, [Target(f"opening ({x},{y})", [(x, y)]) for x, y in zip(xs.tolist(), ys.tolist())]
+
+
+def map_kind(name):
+    """The KINDS entry for a map name, or None if the name is not recognised."""
+    if name.startswith("RaccoonIsland"):
+        return "island"
+    if name == "RaccoonMine":
+        return "mine"
+    if re.fullmatch(r"TentInterior\d\d", name):
+        return "tent"
+    return None
+
+
+def resolve_kind(tile_map, kind=None):
+    """`kind`, or the map's kind from its name.
+
+    A map whose name is not recognised falls back to the border check, with
+    a warning, since an island or interior saved under another name would
+    otherwise pass it unnoticed.
+    """
+    if kind is None:
+        kind = map_kind(tile_map.name)
+        if kind is None:
+            warnings.warn(f"{tile_map.name!r} is not a known map name; checking border "
+                          f"openings (pass kind to choose the check)", stacklevel=3)
+            kind = "border"
+    if kind not in KINDS:
+        raise ValueError(f"unknown map kind: {kind!r} (expected one of {', '.join(KINDS)})")
+    return kind
+
+
+def map_targets(tile_map, labels, kind=None):
+    """(arrival tile, targets) for a map of the given kind (default: from its name)."""
+    kind = resolve_kind(tile_map, kind)
+    if kind == "island":
+        return island_targets(tile_map)
+    if kind == "mine":
+        return MINE_ARRIVAL, [Target(f"exit {x},{y}", [(x, y)]) for x, y in MINE_EXITS]
+    if kind == "tent":
+        return TENT_ARRIVAL, [Target(f"door {x},{y}", [(x, y)]) for x, y in TENT_EXITS]
+    return border_targets(tile_map, labels)
+
+
+def unreachable(labels, start, targets):
+    """Names of the targets not connected to the start tile (all of them if it is blocked)."""
+    height, width = labels.shape
+    x, y = start
+    home = labels[y, x] if 0 <= x < width and 0 <= y < height else 0
+    missing = []
+    for target in targets:
+        cells = np.array(target.cells).reshape(-1, 2)
+        if target.use:
+            cells = (cells[:, None, :] + np.array([(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)])).reshape(-1, 2)
+        inside = (cells[:, 0] >= 0) & (cells[:, 0] < width) & (cells[:, 1] >= 0) & (cells[:, 1] < height)
+        found = np.zeros(len(cells), dtype=bool)
+        found[inside] = labels[cells[inside, 1], cells[inside, 0]] == home
+        if home == 0 or not (found.any() if target.use else found.all()):
+            missing.append(target.name)
+    return missing
+
+
+def validate(tile_map, kind=None):
+    """(start, component count, names of unreachable targets) for a TileMap."""
+    kind = resolve_kind(tile_map, kind)
+    labels, count = label_components(walkable(tile_map, swim=kind == "island"))
+    start, targets = map_targets(tile_map, labels, kind)
+    return start, count, unreachable(labels, start, targets)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check map reachability from the arrival tile.")
+    parser.add_argument("maps", nargs="*", help="maps to check (default: assets/*.tmx)")
+    parser.add_argument("--kind", choices=KINDS,
+                        help="which check to run (default: from each map's name)")
+    args = parser.parse_args()
+
+    paths = args.maps or sorted(glob.glob(os.path.join("assets", "*.tmx")))
+    failed = False
+    for path in paths:
+        began = time.perf_counter()
+        tile_map = read_tmx(path)
+        kind = args.kind or map_kind(tile_map.name)
+        if kind is None:
+            print(f"warning: {path}: not a known map name, checking border openings "
+                  f"(use --kind to choose)")
+            kind = "border"
+        start, count, missing = validate(tile_map, kind)
+        elapsed = time.perf_counter() - began
+        status = "FAIL" if missing else "ok"
+        print(f"{status:4s} {path}: {tile_map.width}x{tile_map.height}, {count} walkable regions, "
+              f"from {start[0]},{start[1]} ({elapsed:.2f}s)")
+        for name in missing:
+            print(f"       unreachable: {name}")
+        failed |= bool(missing)
+    sys.exit(1 if failed else 0)
@@ -1,62 +1,66 @@
 #!/usr/bin/env python3
 """Identify tree canopy tiles and building tiles."""
-from PIL import Image
 import os
+import sys
 
-ASSETS = "/Users/jd/code/stardewvalley/extracted_assets"
+import numpy as np
 
+from tile_query import Query
+from tile_stats import ASSETS, analyze_sheets
 
-def tile_info(img, row, col, tile_size=16, cols=25):
-    x0, y0 = col * tile_size, row * tile_size
-    tile = img.crop((x0, y0, x0 + tile_size, y0 + tile_size))
-    pixels = list(tile.getdata())
-    opaque = [(r, g, b, a) for r, g, b, a in pixels if a > 128]
-    if not opaque:
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "RaccoonIsland"))
+from generate_map import BEACH, OUTDOORS, TOWN  # noqa: E402
+
+# RaccoonIsland.tmx tilesets, so the merged table carries the map's GIDs
+SHEETS = [OUTDOORS, BEACH, TOWN]
+
+CANOPY = Query('sheet == "spring_outdoorsTileSheet" and row < 4'
+               ' and opaque > 0 and g > 80 and opacity > 0.5')
+STRUCTURE = Query('sheet == "spring_outdoorsTileSheet" and 10 <= row < 18 and opaque > 0'
+                  ' and opacity > 0.8 and not (g > 120 and g > r and g > b)')  # non-green, opaque
+STONE = Query('sheet == "spring_town" and 35 <= row < 45 and opaque > 0 and opacity > 0.8'
+              ' and abs(r - g) < 40 and abs(g - b) < 40 and r > 80 and r < 180')
+
+
+def tile_info(table, gid):
+    """Look up a tile's (r, g, b, opacity) by GID, or None if fully transparent."""
+    i = int(np.searchsorted(table["gid"], gid))  # merged table rows are in GID order
+    if not table["opaque"][i]:
         return None
-    avg_r = sum(r for r, g, b, a in opaque) // len(opaque)
-    avg_g = sum(g for r, g, b, a in opaque) // len(opaque)
-    avg_b = sum(b for r, g, b, a in opaque) // len(opaque)
-    return (avg_r, avg_g, avg_b, len(opaque) / len(pixels))
+    return (int(table["r"][i]), int(table["g"][i]), int(table["b"][i]),
+            float(table["opacity"][i]))
+
+
+table = analyze_sheets([os.path.join(ASSETS, os.path.basename(t.image)) for t in SHEETS],
+                       firstgids=[t.firstgid for t in SHEETS])
+town_firstgid, town_cols = TOWN.firstgid, TOWN.columns
 
 
 # Outdoor tilesheet - find good tree canopy tiles (rows 0-3)
 print("=== OUTDOOR SHEET: Tree canopy tiles (rows 0-3) ===")
-img = Image.open(os.path.join(ASSETS, "spring_outdoorsTileSheet.png")).convert("RGBA")
-out_cols = 25
-
-for row in range(4):
-    for col in range(out_cols):
-        info = tile_info(img, row, col)
-        if info:
-            r, g, b, opacity = info
-            gid = row * out_cols + col + 1
-            if g > 80 and opacity > 0.5:
-                kind = "CANOPY" if g > r and g > b else "other"
-                print(f"  GID {gid:3d} (row {row}, col {col:2d}) RGB({r:3d},{g:3d},{b:3d}) op={opacity:.2f} {kind}")
+for i in CANOPY(table):
+    gid, row, col = table["gid"][i], table["row"][i], table["col"][i]
+    r, g, b, opacity = tile_info(table, gid)
+    kind = "CANOPY" if g > r and g > b else "other"
+    print(f"  GID {gid:3d} (row {row}, col {col:2d}) RGB({r:3d},{g:3d},{b:3d}) op={opacity:.2f} {kind}")
 
 # Outdoor tilesheet - find fence/structure tiles (rows 10-18)
 print("\n=== OUTDOOR SHEET: Structure tiles (rows 10-18) ===")
-for row in range(10, 18):
-    for col in range(out_cols):
-        info = tile_info(img, row, col)
-        if info:
-            r, g, b, opacity = info
-            gid = row * out_cols + col + 1
-            if opacity > 0.8 and not (g > 120 and g > r and g > b):  # non-green, opaque
-                print(f"  GID {gid:3d} (row {row:2d}, col {col:2d}) RGB({r:3d},{g:3d},{b:3d}) op={opacity:.2f}")
+for i in STRUCTURE(table):
+    gid, row, col = table["gid"][i], table["row"][i], table["col"][i]
+    r, g, b, opacity = tile_info(table, gid)
+    print(f"  GID {gid:3d} (row {row:2d}, col {col:2d}) RGB({r:3d},{g:3d},{b:3d}) op={opacity:.2f}")
 
 # Town tilesheet - identify a simple house structure
 # Look at rows 28-34, cols 0-10 area (small wooden cabin visible in image)
 print("\n=== TOWN SHEET: Small cabin area (rows 28-34, cols 0-10) ===")
-town_img = Image.open(os.path.join(ASSETS, "spring_town.png")).convert("RGBA")
-town_cols = 32
 for row in range(28, 35):
     tiles = []
     for col in range(11):
-        info = tile_info(town_img, row, col, cols=town_cols)
+        gid = town_firstgid + row * town_cols + col
+        info = tile_info(table, gid)
         if info:
             r, g, b, opacity = info
-            gid = 2503 + row * town_cols + col
             tiles.append(f"{gid}{'*' if opacity < 0.5 else ' '}")
         else:
             tiles.append("....  ")
@@ -67,7 +71,7 @@ print("\n=== TOWN SHEET: Fountain/plaza area (rows 37-43) ===")
 for row in range(37, 44):
     tiles = []
     for col in range(town_cols):
-        info = tile_info(town_img, row, col, cols=town_cols)
+        info = tile_info(table, town_firstgid + row * town_cols + col)
         if info:
             r, g, b, opacity = info
             sym = "." if opacity < 0.3 else "#" if opacity > 0.8 else "~"
@@ -78,12 +82,7 @@ for row in range(37, 44):
 
 # Also find well/fountain structures in the town sheet
 print("\n=== TOWN SHEET: Searching for stone/fountain tiles ===")
-for row in range(35, 45):
-    for col in range(town_cols):
-        info = tile_info(town_img, row, col, cols=town_cols)
-        if info:
-            r, g, b, opacity = info
-            gid = 2503 + row * town_cols + col
-            # Stone/gray with high opacity
-            if opacity > 0.8 and abs(r-g) < 40 and abs(g-b) < 40 and r > 80 and r < 180:
-                print(f"  GID {gid} (row {row}, col {col:2d}) RGB({r:3d},{g:3d},{b:3d}) stone/gray")
+for i in STONE(table):
+    gid, row, col = table["gid"][i], table["row"][i], table["col"][i]
+    r, g, b, opacity = tile_info(table, gid)
+    print(f"  GID {gid} (row {row}, col {col:2d}) RGB({r:3d},{g:3d},{b:3d}) stone/gray")
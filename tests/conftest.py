@@ -0,0 +1,8 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MOD_DIR = os.path.join(ROOT, "RaccoonIsland")
+
+# The tools are flat scripts run from their own directory, not a package.
+sys.path[:0] = [ROOT, MOD_DIR]
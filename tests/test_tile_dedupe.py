@@ -0,0 +1,19 @@
+import numpy as np
+
+from tile_dedupe import exact_groups
+
+
+def test_digest_collision_is_not_a_duplicate():
+    tiles = np.zeros((3, 16, 16, 4), dtype=np.uint8)
+    tiles[:, :, :, 3] = 255
+    tiles[2, 0, 0, 0] = 1  # differs from the others, but shares their digest
+    table = {"digest": np.zeros(3, dtype=np.uint64)}
+    groups = exact_groups(table, np.arange(3), tiles.__getitem__)
+    assert groups == [[0, 1]]
+
+
+def test_transparent_pixel_colour_is_ignored():
+    tiles = np.zeros((2, 16, 16, 4), dtype=np.uint8)
+    tiles[1, 0, 0, :3] = 200  # alpha stays 0
+    table = {"digest": np.zeros(2, dtype=np.uint64)}
+    assert exact_groups(table, np.arange(2), tiles.__getitem__) == [[0, 1]]
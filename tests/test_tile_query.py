@@ -0,0 +1,18 @@
+import numpy as np
+
+from tile_query import select
+
+
+def table():
+    return {
+        "tile_id": np.arange(4),
+        "r": np.array([1, 1, 0, 2]),
+        "g": np.array([2, 0, 2, 4]),
+    }
+
+
+def test_and_or_on_int_operands():
+    # 1 & 2 == 0 bitwise, but `1 and 2` is true
+    assert select(table(), "r and g").tolist() == [0, 3]
+    assert select(table(), "r or g").tolist() == [0, 1, 2, 3]
+    assert select(table(), "not r").tolist() == [2]
@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+from tile_atlas import atlas_path
+from tile_stats import analyze_sheets, cache_path
+
+
+def test_analyze_no_sheets():
+    with pytest.raises(ValueError):
+        analyze_sheets([])
+
+
+def test_same_named_sheets_do_not_share_caches(tmp_path):
+    paths = []
+    for directory in ("extracted", "mod"):
+        os.makedirs(tmp_path / directory)
+        path = tmp_path / directory / "sheet.png"
+        path.write_bytes(b"same bytes")
+        paths.append(str(path))
+    assert cache_path(paths[0]) != cache_path(paths[1])
+    assert atlas_path(paths[0]) != atlas_path(paths[1])
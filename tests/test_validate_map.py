@@ -0,0 +1,19 @@
+import os
+
+import validate_map
+from conftest import MOD_DIR
+from tmx_reader import read_tmx
+
+
+def test_shipped_island_is_reachable():
+    tile_map = read_tmx(os.path.join(MOD_DIR, "assets", "RaccoonIsland.tmx"))
+    start, count, missing = validate_map.validate(tile_map)
+    assert start == validate_map.ISLAND_ARRIVAL
+    assert missing == []
+
+
+def test_island_water_needs_swimming():
+    tile_map = read_tmx(os.path.join(MOD_DIR, "assets", "RaccoonIsland.tmx"))
+    x, y = validate_map.ISLAND_STATUE
+    assert not validate_map.walkable(tile_map)[y, x]
+    assert validate_map.walkable(tile_map, swim=True)[y, x]
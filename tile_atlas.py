@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Raw, memory-mappable RGBA tile atlases for the extracted tilesheets.
+
+An atlas is a 64-byte header followed by the sheet's tiles in tile-major
+order, each tile_size x tile_size x 4 bytes of RGBA. Opening one maps the
+file read-only, so tile i is a zero-copy slice and only the pages of the
+tiles actually touched are ever read.
+
+Header (little-endian):
+    8s   magic b"RGBATILE"
+    I    format version
+    I    tile size in pixels
+    I    columns
+    I    rows
+    20s  SHA-1 of the source PNG (used to detect re-extracted sheets)
+    pad  to 64 bytes
+
+Usage:
+    python tile_atlas.py [DIR]    convert every sheet in DIR (default: extracted_assets)
+"""
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from tile_stats import ASSETS, ROOT, TILE_SIZE, decode_sheet, find_sheets, sheet_key
+
+ATLAS_DIR = os.path.join(ROOT, ".tile_atlas")
+MAGIC = b"RGBATILE"
+VERSION = 1
+HEADER = struct.Struct("<8sIIII20s")
+HEADER_SIZE = 64
+
+
+def atlas_path(png_path):
+    """Where the atlas for a tilesheet PNG lives."""
+    return os.path.join(ATLAS_DIR, sheet_key(png_path) + ".rgba")
+
+
+def _png_digest(png_path):
+    with open(png_path, "rb") as f:
+        return hashlib.sha1(f.read()).digest()
+
+
+def write_atlas(png_path, path=None, tile_size=TILE_SIZE):
+    """Convert a tilesheet PNG into an atlas file and return its path."""
+    path = path or atlas_path(png_path)
+    tiles = decode_sheet(png_path, tile_size=tile_size)
+    rows, cols = tiles.shape[:2]
+    header = HEADER.pack(MAGIC, VERSION, tile_size, cols, rows, _png_digest(png_path))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        f.write(np.ascontiguousarray(tiles).tobytes())
+    os.replace(tmp, path)
+    return path
+
+
+class Atlas:
+    """A read-only, memory-mapped tile atlas."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.tile_size, self.cols, self.rows, self.source_digest = \
+            HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} tile atlas")
+        self.path = path
+        size = self.tile_size
+        self.tiles = np.frombuffer(self._map, dtype=np.uint8, offset=HEADER_SIZE,
+                                   count=self.rows * self.cols * size * size * 4
+                                   ).reshape(-1, size, size, 4)
+
+    def __len__(self):
+        return len(self.tiles)
+
+    def tile(self, i):
+        """Tile i as a (tile_size, tile_size, 4) view into the mapping."""
+        return self.tiles[i]
+
+    def grid(self):
+        """All tiles as a (rows, cols, tile_size, tile_size, 4) view."""
+        return self.tiles.reshape(self.rows, self.cols, *self.tiles.shape[1:])
+
+    def close(self):
+        self.tiles = None
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_atlas(png_path, tile_size=TILE_SIZE):
+    """Open the atlas for a tilesheet, (re)building it if missing or stale."""
+    path = atlas_path(png_path)
+    if os.path.exists(path):
+        atlas = Atlas(path)
+        if atlas.tile_size == tile_size and atlas.source_digest == _png_digest(png_path):
+            return atlas
+        atlas.close()
+    write_atlas(png_path, path, tile_size)
+    return Atlas(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert tilesheets to raw RGBA atlases.")
+    parser.add_argument("directory", nargs="?", default=ASSETS)
+    args = parser.parse_args()
+
+    for png in find_sheets(args.directory):
+        with open_atlas(png) as atlas:
+            print(f"  {os.path.relpath(atlas.path, ROOT)}: "
+                  f"{atlas.cols} cols x {atlas.rows} rows, {len(atlas)} tiles")
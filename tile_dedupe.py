@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Find exact and near-duplicate tiles across tilesheets.
+
+Exact duplicates are grouped by the per-tile pixel digest in one pass over
+a dict, then confirmed pixel by pixel within each digest group.
+Near-duplicates are found with locality-sensitive hashing over the 4x4
+RGBA descriptors: each descriptor is hashed into buckets by several random
+quantized projections, and only tiles sharing a bucket are compared.
+Every duplicate is mapped to the lowest GID in its group.
+
+Pass the sheets in a map's tileset order so the GIDs match that map:
+
+    python tile_dedupe.py spring_outdoorsTileSheet.png spring_beach.png \
+        spring_town.png -o duplicates.json
+"""
+import argparse
+import json
+import os
+from collections import defaultdict
+
+import numpy as np
+
+from tile_atlas import open_atlas
+from tile_stats import ASSETS, TILE_SIZE, analyze_sheets, find_sheets
+
+TOLERANCE = 6.0  # max descriptor distance for a near-duplicate
+LSH_TABLES = 8
+LSH_PROJECTIONS = 4
+
+
+def exact_groups(table, candidates, tile):
+    """Group table rows with identical pixels: [[row, ...], ...] with 2+ members.
+
+    Rows are bucketed by pixel digest and then compared pixel by pixel
+    within each bucket, so a digest collision cannot merge different tiles.
+    `tile(row)` returns a row's (tile_size, tile_size, 4) pixels.
+    """
+    buckets = defaultdict(list)
+    for i, digest in zip(candidates.tolist(), table["digest"][candidates].tolist()):
+        buckets[digest].append(i)
+    groups = []
+    for rows in buckets.values():
+        if len(rows) < 2:
+            continue
+        classes = []  # (pixels, rows) per distinct tile in the bucket
+        for i in rows:
+            pixels = _visible_pixels(tile(i))
+            for first, members in classes:
+                if np.array_equal(first, pixels):
+                    members.append(i)
+                    break
+            else:
+                classes.append((pixels, [i]))
+        groups.extend(members for _, members in classes if len(members) > 1)
+    return groups
+
+
+def _visible_pixels(pixels):
+    """Pixels with the colour of fully transparent ones zeroed, as the digest sees them."""
+    return np.where(pixels[..., 3:] > 0, pixels, 0)
+
+
+def tile_reader(paths, tile_size=TILE_SIZE):
+    """`tile(row)` for a table merged from `paths` by analyze_sheets.
+
+    Tiles are read from each sheet's memory-mapped atlas, so only the tiles
+    compared are ever loaded.
+    """
+    atlases = [open_atlas(path, tile_size) for path in paths]
+    starts = np.cumsum([0] + [len(atlas) for atlas in atlases])
+
+    def tile(row):
+        sheet = int(np.searchsorted(starts, row, side="right")) - 1
+        return atlases[sheet].tile(row - starts[sheet])
+    return tile
+
+
+def near_pairs(vectors, tolerance=TOLERANCE, tables=LSH_TABLES,
+               projections=LSH_PROJECTIONS, seed=0):
+    """Pairs (i, j) of vectors within `tolerance` of each other, found via p-stable LSH."""
+    rng = np.random.default_rng(seed)
+    width = 4.0 * tolerance
+    dims = vectors.shape[1]
+    pairs = set()
+    for _ in range(tables):
+        planes = rng.standard_normal((dims, projections))
+        offsets = rng.uniform(0, width, projections)
+        keys = np.floor((vectors @ planes + offsets) / width).astype(np.int64)
+        _, bucket = np.unique(keys, axis=0, return_inverse=True)
+        order = np.argsort(bucket.ravel(), kind="stable")
+        bounds = np.flatnonzero(np.diff(bucket.ravel()[order])) + 1
+        for members in np.split(order, bounds):
+            if len(members) < 2:
+                continue
+            block = vectors[members]
+            norms = (block ** 2).sum(axis=1)
+            dist2 = norms[:, None] + norms[None, :] - 2.0 * (block @ block.T)
+            a, b = np.nonzero(np.triu(dist2 <= tolerance ** 2, k=1))
+            pairs.update(zip(members[a].tolist(), members[b].tolist()))
+    return pairs
+
+
+def _union_groups(pairs):
+    """Connected groups of the (i, j) pairs, each sorted ascending."""
+    parent = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in pairs:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+    groups = defaultdict(list)
+    for x in list(parent):
+        groups[find(x)].append(x)
+    return [sorted(members) for members in groups.values()]
+
+
+def find_duplicates(table, tile, tolerance=TOLERANCE):
+    """Map duplicate GIDs to the lowest GID of their group.
+
+    `tile(row)` returns a table row's pixels (see tile_reader).
+
+    Returns (exact, near): two {gid: canonical_gid} dicts. Fully transparent
+    tiles are ignored; near-duplicates are only searched among the first
+    tile of each exact group.
+    """
+    gid = table["gid"]
+    visible = np.flatnonzero(table["descriptor"][:, 3::4].any(axis=1))
+
+    exact = {}
+    for rows in exact_groups(table, visible, tile):
+        canonical = int(gid[rows[0]])
+        exact.update((int(gid[i]), canonical) for i in rows[1:])
+
+    unique = np.array([i for i in visible.tolist() if int(gid[i]) not in exact])
+    near = {}
+    if len(unique) > 1:
+        pairs = near_pairs(table["descriptor"][unique], tolerance)
+        for members in _union_groups(pairs):
+            canonical = int(gid[unique[members[0]]])
+            near.update((int(gid[unique[m]]), canonical) for m in members[1:])
+    return exact, near
+
+
+def remap_table(size, *mappings):
+    """GID lookup array applying each {gid: canonical} map in turn.
+
+    Use as `lut[layer]` on a GID array, e.g. remap_table(n, exact, near)
+    collapses exact duplicates first and then near-duplicates.
+    """
+    lut = np.arange(size, dtype=np.uint32)
+    for mapping in mappings:
+        step = np.arange(size, dtype=np.uint32)
+        if mapping:
+            step[list(mapping)] = list(mapping.values())
+        lut = step[lut]
+    return lut
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find duplicate tiles across tilesheets.")
+    parser.add_argument("sheets", nargs="*",
+                        help="sheet file names in tileset order (default: every sheet)")
+    parser.add_argument("--dir", default=ASSETS)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help=f"near-duplicate descriptor distance (default: {TOLERANCE})")
+    parser.add_argument("-o", "--output", help="write the duplicate map as JSON")
+    args = parser.parse_args()
+
+    if args.sheets:
+        paths = [os.path.join(args.dir, name) for name in args.sheets]
+    else:
+        paths = find_sheets(args.dir)
+    table = analyze_sheets(paths)
+    exact, near = find_duplicates(table, tile_reader(paths), args.tolerance)
+
+    def label(g):
+        i = g - 1  # merged table rows are in GID order
+        return f"{table['sheet'][i]}({table['row'][i]},{table['col'][i]})"
+
+    for title, mapping in (("Exact", exact), ("Near", near)):
+        groups = defaultdict(list)
+        for g, canonical in mapping.items():
+            groups[canonical].append(g)
+        print(f"{title} duplicates: {len(mapping)} tiles in {len(groups)} groups")
+        for canonical, members in sorted(groups.items())[:20]:
+            print(f"  GID {canonical} {label(canonical)} <- "
+                  + ", ".join(f"{g} {label(g)}" for g in sorted(members)[:6])
+                  + (" ..." if len(members) > 6 else ""))
+
+    if args.output:
+        sheets = {}
+        for name in dict.fromkeys(table["sheet"].tolist()):
+            sheets[name] = int(table["gid"][table["sheet"] == name][0])
+        with open(args.output, "w") as f:
+            json.dump({
+                "firstgids": sheets,
+                "exact": {str(g): c for g, c in sorted(exact.items())},
+                "near": {str(g): c for g, c in sorted(near.items())},
+            }, f, indent=1)
+        print(f"Wrote {args.output}")
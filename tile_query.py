@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Declarative tile classification queries over the feature table.
+
+A query is a Python-style boolean expression over per-tile features,
+optionally followed by "order by FIELD [asc|desc]" and "limit N":
+
+    opacity > 0.8 and b > r * 2 order by variance limit 15
+    sheet == "spring_town" and 35 <= row < 45 and abs(r - g) < 40
+
+The expression is compiled once into a tree of NumPy operations, so
+evaluating it is a handful of vectorized passes over the whole table.
+Fields are the 1-D columns of a tile_stats feature table: sheet, tile_id,
+gid, row, col, r, g, b, variance, opaque, opacity.
+
+Usage:
+    python tile_query.py "QUERY" [SHEET.png ...]
+"""
+import argparse
+import ast
+import operator
+import os
+import re
+
+import numpy as np
+
+from tile_stats import ASSETS, analyze_sheets, find_sheets
+
+_BINARY = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod,
+}
+_COMPARE = {
+    ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt,
+    ast.GtE: operator.ge, ast.Eq: operator.eq, ast.NotEq: operator.ne,
+}
+_FUNCTIONS = {"abs": np.abs, "sqrt": np.sqrt, "min": np.minimum, "max": np.maximum}
+
+_CLAUSES = re.compile(
+    r"^(?P<where>.*?)"
+    r"(?:\s+order\s+by\s+(?P<order>\w+)(?:\s+(?P<direction>asc|desc))?)?"
+    r"(?:\s+limit\s+(?P<limit>\d+))?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+class QueryError(ValueError):
+    pass
+
+
+def _compile(node):
+    """Turn an expression AST into a function of the feature table."""
+    if isinstance(node, ast.Expression):
+        return _compile(node.body)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str)):
+        value = node.value
+        return lambda table: value
+    if isinstance(node, ast.Name):
+        name = node.id
+        return lambda table: table[name]
+    if isinstance(node, ast.BoolOp):
+        parts = [_compile(v) for v in node.values]
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+
+        def bool_op(table):
+            result = parts[0](table)
+            for part in parts[1:]:
+                result = combine(result, part(table))
+            return result
+        return bool_op
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.USub)):
+        operand = _compile(node.operand)
+        if isinstance(node.op, ast.Not):
+            return lambda table: np.logical_not(operand(table))
+        return lambda table: -operand(table)
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY:
+        op, left, right = _BINARY[type(node.op)], _compile(node.left), _compile(node.right)
+        return lambda table: op(left(table), right(table))
+    if isinstance(node, ast.Compare) and all(type(op) in _COMPARE for op in node.ops):
+        terms = [_compile(node.left)] + [_compile(c) for c in node.comparators]
+        ops = [_COMPARE[type(op)] for op in node.ops]
+
+        def compare(table):
+            values = [term(table) for term in terms]
+            result = ops[0](values[0], values[1])
+            for i in range(1, len(ops)):  # chained: a < b < c
+                result = result & ops[i](values[i], values[i + 1])
+            return result
+        return compare
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id in _FUNCTIONS and not node.keywords):
+        func, args = _FUNCTIONS[node.func.id], [_compile(a) for a in node.args]
+        return lambda table: func(*(arg(table) for arg in args))
+    raise QueryError(f"unsupported syntax: {ast.unparse(node)!r}")
+
+
+def _is_field(table, name):
+    """Whether `name` is a 1-D column of the table (2-D ones such as descriptor are not fields)."""
+    return name in table and np.ndim(table[name]) == 1
+
+
+def _row_count(table):
+    for column in table.values():
+        if np.ndim(column) == 1:
+            return len(column)
+    raise QueryError("feature table has no 1-D columns")
+
+
+class Query:
+    """A compiled tile query: call it on a feature table to get matching row indices."""
+
+    def __init__(self, text):
+        match = _CLAUSES.match(text.strip())
+        where = match.group("where").strip()
+        try:
+            tree = ast.parse(where, mode="eval")
+        except SyntaxError as e:
+            raise QueryError(f"bad query expression {where!r}: {e.msg}") from None
+        self.text = text
+        self.fields = sorted({n.id for n in ast.walk(tree) if isinstance(n, ast.Name)}
+                             - set(_FUNCTIONS))
+        self.predicate = _compile(tree)
+        self.order = match.group("order")
+        self.descending = (match.group("direction") or "").lower() == "desc"
+        self.limit = int(match.group("limit")) if match.group("limit") else None
+
+    def mask(self, table):
+        """Boolean mask of matching rows, in table order."""
+        missing = [f for f in self.fields if not _is_field(table, f)]
+        if missing:
+            raise QueryError(f"unknown or non-1-D field(s): {', '.join(missing)}")
+        mask = self.predicate(table)
+        return np.broadcast_to(np.asarray(mask, dtype=bool), (_row_count(table),))
+
+    def __call__(self, table):
+        rows = np.flatnonzero(self.mask(table))
+        if self.order:
+            if not _is_field(table, self.order):
+                raise QueryError(f"unknown order field: {self.order}")
+            keys = table[self.order][rows]
+            if self.descending:
+                # Stable descending order: sort the reversed keys, then map back
+                order = len(keys) - 1 - np.argsort(keys[::-1], kind="stable")[::-1]
+            else:
+                order = np.argsort(keys, kind="stable")
+            rows = rows[order]
+        return rows[:self.limit] if self.limit is not None else rows
+
+
+def select(table, text):
+    """Compile and run a query in one step."""
+    return Query(text)(table)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a tile query over the feature table.")
+    parser.add_argument("query")
+    parser.add_argument("sheets", nargs="*",
+                        help="sheet file names in tileset order (default: every sheet)")
+    parser.add_argument("--dir", default=ASSETS)
+    args = parser.parse_args()
+
+    if args.sheets:
+        paths = [os.path.join(args.dir, name) for name in args.sheets]
+    else:
+        paths = find_sheets(args.dir)
+    table = analyze_sheets(paths)
+    try:
+        rows = select(table, args.query)
+    except QueryError as e:
+        parser.error(str(e))
+
+    for i in rows:
+        print(f"  GID {table['gid'][i]:5d} {table['sheet'][i]} "
+              f"(row {table['row'][i]:2d}, col {table['col'][i]:2d}) "
+              f"RGB({table['r'][i]:3d},{table['g'][i]:3d},{table['b'][i]:3d}) "
+              f"var={table['variance'][i]:.0f} op={table['opacity'][i]:.2f}")
+    print(f"{len(rows)} tiles")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Find the tiles most similar to a given tile across every tilesheet.
+
+Each tile is described by its 4x4 premultiplied RGBA downsample (64 floats,
+computed and cached by tile_stats). The index is just those descriptors
+stacked into one matrix, so a query is one matrix-vector product over all
+tiles, which stays well under a millisecond for tens of thousands of tiles.
+
+Usage:
+    python tile_search.py spring_beach 7 15 [-k 10]
+    python tile_search.py --png my_tile.png [-k 10]
+"""
+import argparse
+
+import numpy as np
+from PIL import Image
+
+from tile_stats import ASSETS, TILE_SIZE, analyze_sheets, find_sheets, tile_stats
+
+
+class TileIndex:
+    """Nearest-neighbour index over the non-empty tiles of a merged feature table."""
+
+    def __init__(self, table):
+        keep = table["descriptor"][:, 3::4].any(axis=1)  # skip fully transparent tiles
+        self.sheet = table["sheet"][keep]
+        self.tile_id = table["tile_id"][keep]
+        self.row = table["row"][keep]
+        self.col = table["col"][keep]
+        self.vectors = table["descriptor"][keep]
+        self.norms = (self.vectors ** 2).sum(axis=1)
+
+    @classmethod
+    def build(cls, directory=ASSETS, workers=None):
+        """Index every sheet in a directory (descriptors come from the tile cache)."""
+        return cls(analyze_sheets(find_sheets(directory), workers=workers))
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def find(self, sheet, row, col):
+        """Position of a tile in the index, or None if it is empty or unknown."""
+        hits = np.flatnonzero((self.sheet == sheet) & (self.row == row) & (self.col == col))
+        return int(hits[0]) if len(hits) else None
+
+    def query(self, descriptor, k=10, exclude=None):
+        """Return [(index position, distance)] for the k nearest tiles."""
+        dist2 = self.norms - 2.0 * (self.vectors @ descriptor) + (descriptor ** 2).sum()
+        if exclude is not None:
+            dist2[exclude] = np.inf
+        k = min(k, len(dist2))
+        nearest = np.argpartition(dist2, k - 1)[:k]
+        nearest = nearest[np.argsort(dist2[nearest], kind="stable")]
+        return [(int(i), float(np.sqrt(max(dist2[i], 0.0)))) for i in nearest]
+
+    def describe(self, i):
+        return f"{self.sheet[i]} tile_id={self.tile_id[i]} (row {self.row[i]}, col {self.col[i]})"
+
+
+def png_descriptor(path):
+    """Descriptor of a single 16x16 tile stored as a PNG."""
+    pixels = np.asarray(Image.open(path).convert("RGBA"))
+    if pixels.shape[:2] != (TILE_SIZE, TILE_SIZE):
+        raise ValueError(f"{path} is {pixels.shape[1]}x{pixels.shape[0]}, "
+                         f"expected a {TILE_SIZE}x{TILE_SIZE} tile")
+    return tile_stats(pixels[None, None])["descriptor"][0]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find the k most similar tiles.")
+    parser.add_argument("sheet", nargs="?", help="sheet name, e.g. spring_beach")
+    parser.add_argument("row", nargs="?", type=int)
+    parser.add_argument("col", nargs="?", type=int)
+    parser.add_argument("--png", help="query with a 16x16 PNG instead of a sheet tile")
+    parser.add_argument("-k", type=int, default=10, help="number of results (default: 10)")
+    parser.add_argument("--dir", default=ASSETS, help="directory of tilesheets to search")
+    args = parser.parse_args()
+
+    index = TileIndex.build(args.dir)
+    if args.png:
+        query, exclude = png_descriptor(args.png), None
+    elif args.sheet is not None and args.row is not None and args.col is not None:
+        exclude = index.find(args.sheet, args.row, args.col)
+        if exclude is None:
+            parser.error(f"{args.sheet} ({args.row}, {args.col}) is empty or not in {args.dir}")
+        query = index.vectors[exclude]
+    else:
+        parser.error("give SHEET ROW COL or --png")
+
+    print(f"{args.k} nearest of {len(index)} tiles:")
+    for rank, (i, dist) in enumerate(index.query(query, k=args.k, exclude=exclude), 1):
+        print(f"  {rank:2d}. {index.describe(i)} dist={dist:.1f}")
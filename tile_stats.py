@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""Whole-sheet tile statistics shared by the tilesheet analyzers.
+
+A sheet is decoded once into a (rows, cols, 16, 16, 4) array and every
+per-tile stat is computed in one batched NumPy pass. The result is a
+"feature table": a dict of flat arrays indexed by local tile id.
+
+Feature tables are cached as .npz files in .tile_cache/, keyed by the
+sheet's content hash and the analysis parameters, so repeat runs skip
+PNG decoding entirely and a re-extracted sheet is picked up automatically.
+
+Run as a script to analyze every sheet in extracted_assets/ in parallel:
+
+    python tile_stats.py [DIR] [-j WORKERS] [-o table.csv]
+"""
+import argparse
+import csv
+import glob
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+from PIL import Image
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ASSETS = os.path.join(ROOT, "extracted_assets")
+CACHE_DIR = os.path.join(ROOT, ".tile_cache")
+CACHE_VERSION = 3  # bump when tile_stats() output changes
+
+TILE_SIZE = 16
+ALPHA_THRESHOLD = 128  # pixels with alpha above this count as opaque
+DESCRIPTOR_CELLS = 4  # similarity descriptors downsample each tile to 4x4 RGBA
+
+
+def load_sheet(path, tile_size=TILE_SIZE, cols=None):
+    """A tilesheet as a (rows, cols, tile_size, tile_size, 4) uint8 array.
+
+    Reads through the sheet's memory-mapped atlas (see tile_atlas.py),
+    building it on first use, unless an explicit column count disagrees
+    with the image width.
+    """
+    from tile_atlas import open_atlas  # tile_atlas imports this module
+
+    atlas = open_atlas(path, tile_size)
+    if cols is None or cols == atlas.cols:
+        return atlas.grid()
+    atlas.close()
+    return decode_sheet(path, tile_size, cols)
+
+
+def decode_sheet(path, tile_size=TILE_SIZE, cols=None):
+    """Decode a tilesheet PNG into a (rows, cols, tile_size, tile_size, 4) uint8 array."""
+    img = Image.open(path).convert("RGBA")
+    if cols is None:
+        cols = img.width // tile_size
+    rows = img.height // tile_size
+    pixels = np.asarray(img)[:rows * tile_size, :cols * tile_size]
+    return pixels.reshape(rows, tile_size, cols, tile_size, 4).swapaxes(1, 2)
+
+
+def tile_stats(tiles, alpha_threshold=ALPHA_THRESHOLD):
+    """Compute per-tile colour stats for a (rows, cols, th, tw, 4) tile array.
+
+    Averages are integer (floor) means over opaque pixels and the variance is
+    the mean squared RGB distance from that average, matching the original
+    per-tile loops. Fully transparent tiles get zeros.
+
+    "descriptor" is a compact (n, 64) float32 similarity descriptor: the
+    tile downsampled to 4x4 premultiplied RGBA. "digest" is a 64-bit hash
+    of the tile's pixels, equal for pixel-identical tiles (the colour of
+    fully transparent pixels is ignored).
+    """
+    rows, cols, th, tw, _ = tiles.shape
+    flat = tiles.reshape(rows * cols, th * tw, 4)
+    rgb = flat[..., :3].astype(np.int64)
+    opaque = flat[..., 3] > alpha_threshold
+
+    count = opaque.sum(axis=1)
+    safe = np.maximum(count, 1)
+    avg = (rgb * opaque[..., None]).sum(axis=1) // safe[:, None]
+    sq = ((rgb - avg[:, None, :]) ** 2).sum(axis=2)
+    variance = (sq * opaque).sum(axis=1) / safe
+
+    cells = DESCRIPTOR_CELLS
+    rgba = flat.astype(np.float32)
+    rgba[..., :3] *= rgba[..., 3:] / 255.0
+    blocks = rgba.reshape(rows * cols, cells, th // cells, cells, tw // cells, 4)
+    descriptor = blocks.mean(axis=(2, 4)).reshape(rows * cols, -1)
+
+    tile_id = np.arange(rows * cols)
+    return {
+        "tile_id": tile_id,
+        "row": tile_id // cols,
+        "col": tile_id % cols,
+        "r": avg[:, 0],
+        "g": avg[:, 1],
+        "b": avg[:, 2],
+        "variance": variance,
+        "opaque": count,
+        "opacity": count / (th * tw),
+        "descriptor": descriptor,
+        "digest": _pixel_digest(flat),
+    }
+
+
+def content_hash(path):
+    """SHA-1 of a file's bytes."""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def sheet_key(path):
+    """File-name-safe key for a sheet: its stem plus a hash of its directory.
+
+    Caches are keyed by this rather than the stem alone, so same-named
+    sheets in different directories (e.g. extracted and mod assets) keep
+    separate entries instead of evicting each other.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    directory = os.path.dirname(os.path.realpath(path))
+    return f"{stem}.{hashlib.sha1(directory.encode()).hexdigest()[:8]}"
+
+
+def cache_path(path, tile_size=TILE_SIZE, cols=None, alpha_threshold=ALPHA_THRESHOLD):
+    """Cache file for a sheet's feature table under the given parameters."""
+    stem = sheet_key(path)
+    # The version goes into the content part so a bump prunes old entries too
+    digest = hashlib.sha1(f"v{CACHE_VERSION}-{content_hash(path)}".encode()).hexdigest()
+    params = f"t{tile_size}-c{cols}-a{alpha_threshold}"
+    key = hashlib.sha1(params.encode()).hexdigest()[:8]
+    return os.path.join(CACHE_DIR, f"{stem}-{digest[:16]}-{key}.npz")
+
+
+def _prune_stale(entry):
+    """Remove cache entries for the same sheet that were built from other content."""
+    name = os.path.basename(entry)
+    stem, digest, _ = name.rsplit("-", 2)
+    for other in os.listdir(CACHE_DIR):
+        parts = other.rsplit("-", 2)
+        if len(parts) == 3 and parts[0] == stem and parts[1] != digest:
+            os.remove(os.path.join(CACHE_DIR, other))
+
+
+def _pixel_digest(flat):
+    """FNV-1a style 64-bit hash over each tile's pixels, one word column at a time."""
+    visible = np.where(flat[..., 3:] > 0, flat, 0).astype(np.uint8)
+    words = visible.reshape(len(flat), -1).view(np.uint64)
+    digest = np.full(len(flat), 0xCBF29CE484222325, dtype=np.uint64)
+    prime = np.uint64(0x100000001B3)
+    for column in words.T:
+        digest = (digest ^ column) * prime
+    return digest
+
+
+def sheet_stats(path, tile_size=TILE_SIZE, cols=None, alpha_threshold=ALPHA_THRESHOLD,
+                cache=True):
+    """Load a tilesheet and return its feature table, using the on-disk cache."""
+    entry = cache_path(path, tile_size, cols, alpha_threshold) if cache else None
+    if entry and os.path.exists(entry):
+        with np.load(entry) as data:
+            return {name: data[name] for name in data.files}
+
+    tiles = load_sheet(path, tile_size=tile_size, cols=cols)
+    stats = tile_stats(tiles, alpha_threshold=alpha_threshold)
+
+    if entry:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = entry + ".tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, **stats)
+        os.replace(tmp, entry)
+        _prune_stale(entry)
+    return stats
+
+
+def find_sheets(directory=ASSETS):
+    """All PNG tilesheets in a directory, sorted by file name."""
+    return sorted(glob.glob(os.path.join(directory, "*.png")))
+
+
+def analyze_sheets(paths, workers=None, tile_size=TILE_SIZE, alpha_threshold=ALPHA_THRESHOLD,
+                   firstgids=None):
+    """Analyze several sheets and merge them into one feature table.
+
+    Each sheet's grid is inferred from its image size. Firstgids are
+    allocated in the order the paths are given, so passing the sheets in a
+    map's tileset order reproduces that map's GIDs; pass `firstgids` to use
+    a map's own (e.g. from its tileset registry). Sheets missing from the
+    cache are analyzed in a process pool. Raises ValueError when `paths`
+    is empty.
+    """
+    if not paths:
+        raise ValueError("no tilesheets to analyze")
+    analyze = partial(sheet_stats, tile_size=tile_size, alpha_threshold=alpha_threshold)
+    pending = [p for p in paths
+               if not os.path.exists(cache_path(p, tile_size, None, alpha_threshold))]
+    results = {}
+    if len(pending) > 1 and workers != 1:
+        with ProcessPoolExecutor(workers) as pool:
+            results = dict(zip(pending, pool.map(analyze, pending)))
+    tables = [results[p] if p in results else analyze(p) for p in paths]
+
+    counts = [len(t["tile_id"]) for t in tables]
+    if firstgids is None:
+        firstgids = np.cumsum([1] + counts[:-1])
+    names = [os.path.splitext(os.path.basename(p))[0] for p in paths]
+
+    merged = {name: np.concatenate([t[name] for t in tables]) for name in tables[0]}
+    merged["sheet"] = np.repeat(names, counts)
+    merged["gid"] = merged["tile_id"] + np.repeat(firstgids, counts)
+    return merged
+
+
+def write_csv(table, path):
+    """Write a merged feature table as CSV, one row per tile."""
+    fields = ["sheet", "tile_id", "gid", "row", "col", "r", "g", "b",
+              "variance", "opaque", "opacity"]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        writer.writerows(zip(*(table[name].tolist() for name in fields)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze every tilesheet in a directory.")
+    parser.add_argument("directory", nargs="?", default=ASSETS)
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="process pool size (default: CPU count)")
+    parser.add_argument("-o", "--output", help="write the merged table to this CSV file")
+    args = parser.parse_args()
+
+    paths = find_sheets(args.directory)
+    table = analyze_sheets(paths, workers=args.workers)
+
+    for name in dict.fromkeys(table["sheet"].tolist()):
+        in_sheet = table["sheet"] == name
+        ids = table["tile_id"][in_sheet]
+        gids = table["gid"][in_sheet]
+        rows, cols = table["row"][in_sheet].max() + 1, table["col"][in_sheet].max() + 1
+        print(f"  {name:30s} {cols:3d} cols x {rows:3d} rows  "
+              f"{len(ids):5d} tiles  firstgid={gids[0]}")
+    print(f"{len(table['gid'])} tiles from {len(paths)} sheets")
+
+    if args.output:
+        write_csv(table, args.output)
+        print(f"Wrote {args.output}")